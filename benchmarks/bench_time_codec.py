@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Time Codec Benchmark
+Compares bulk time tag parsing with per-row datetime.strptime
+"""
+
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from luft.utils import time_codec
+from luft.utils.time_codec import parse_time_tags, format_time_tags
+
+
+def make_time_tags(count: int, fmt: str):
+    """Generate a 1-minute cadence column of time tags, as NOAA feeds do."""
+    start = datetime(2025, 11, 23) + timedelta(minutes=random.randint(0, 10000))
+    return [(start + timedelta(minutes=i)).strftime(fmt) for i in range(count)]
+
+
+def strptime_rows(tags, fmt: str):
+    epoch = datetime(1970, 1, 1)
+    return [(datetime.strptime(tag, fmt) - epoch) // timedelta(microseconds=1) for tag in tags]
+
+
+def bench(label: str, func, repeat: int, rows: int, baseline: float = None) -> float:
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    rate = rows / best / 1e6
+    speedup = f"  ({baseline / best:5.1f}x)" if baseline else ""
+    print(f"  {label:<32} {best * 1000:9.2f} ms  {rate:6.2f} M rows/s{speedup}")
+    return best
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the LUFT time codec')
+    parser.add_argument('--rows', type=int, default=100000, help='Time tags per column')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions (best is reported)')
+    args = parser.parse_args()
+
+    formats = [
+        ('NOAA RTSW', '%Y-%m-%dT%H:%M:%S'),
+        ('NOAA products', '%Y-%m-%d %H:%M:%S.000'),
+    ]
+
+    for name, fmt in formats:
+        tags = make_time_tags(args.rows, fmt)
+        print(f"\n{name} ({args.rows} rows, e.g. {tags[0]!r})")
+
+        baseline = bench("per-row strptime", lambda: strptime_rows(tags, fmt), args.repeat, args.rows)
+        bench("parse_time_tags (fixed-format)",
+              lambda: parse_time_tags(tags, use_numpy=False), args.repeat, args.rows, baseline)
+        if time_codec.np is not None:
+            bench("parse_time_tags (datetime64)",
+                  lambda: parse_time_tags(tags, use_numpy=True), args.repeat, args.rows, baseline)
+
+        expected = strptime_rows(tags, fmt)
+        assert list(parse_time_tags(tags, use_numpy=False)) == expected
+
+        epochs = parse_time_tags(tags)
+        bench("format_time_tags", lambda: format_time_tags(epochs), args.repeat, args.rows)
+
+    if time_codec.np is None:
+        print("\nNumPy not installed; datetime64 path skipped")
+
+
+if __name__ == '__main__':
+    main()
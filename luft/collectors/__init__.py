@@ -4,5 +4,6 @@ Data collectors initialization
 
 from .solar_wind_collector import SolarWindCollector
 from .cosmic_data_collector import CosmicDataCollector
+from .feed_collector import FeedCollector, Feed, register_decoder
 
-__all__ = ['SolarWindCollector', 'CosmicDataCollector']
+__all__ = ['SolarWindCollector', 'CosmicDataCollector', 'FeedCollector', 'Feed', 'register_decoder']
@@ -5,7 +5,7 @@ Collects cosmic ray and particle data from public sources
 
 import requests
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,7 +24,7 @@ class CosmicDataCollector:
             config: Configuration dictionary with data source URLs
         """
         self.config = config or {}
-        self.sources = {
+        self.sources = self.config.get('sources') or {
             'noaa_proton_flux': 'https://services.swpc.noaa.gov/json/goes/primary/integral-protons-plot-6-hour.json',
             'noaa_electron_flux': 'https://services.swpc.noaa.gov/json/goes/primary/integral-electrons-plot-6-hour.json',
             'noaa_xray_flux': 'https://services.swpc.noaa.gov/json/goes/primary/xrays-6-hour.json'
@@ -42,24 +42,38 @@ class CosmicDataCollector:
             'sources': {}
         }
         
+        for source_name, entry in self.iter_realtime_data():
+            collected_data['sources'][source_name] = entry
+        
+        return collected_data
+    
+    def iter_realtime_data(self) -> Iterator[Tuple[str, Dict]]:
+        """
+        Collect real-time cosmic data one source at a time.
+        
+        Each source's entry is yielded as soon as it is fetched so callers
+        can persist it without holding the other sources in memory.
+        
+        Yields:
+            (source name, entry with status, data and collection timestamp)
+        """
         for source_name, url in self.sources.items():
             try:
                 logger.info(f"Collecting data from {source_name}")
                 data = self._fetch_data(url)
-                collected_data['sources'][source_name] = {
+                entry = {
                     'status': 'success',
                     'data': data,
                     'collected_at': datetime.utcnow().isoformat()
                 }
             except Exception as e:
                 logger.error(f"Error collecting from {source_name}: {e}")
-                collected_data['sources'][source_name] = {
+                entry = {
                     'status': 'error',
                     'error': str(e),
                     'collected_at': datetime.utcnow().isoformat()
                 }
-        
-        return collected_data
+            yield source_name, entry
     
     def _fetch_data(self, url: str, timeout: int = 30) -> Dict:
         """
@@ -0,0 +1,295 @@
+"""
+Feed Collector
+Config-driven collector engine for any number of feeds
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _decode_json(response: requests.Response) -> Any:
+    return response.json()
+
+
+def _decode_text(response: requests.Response) -> Any:
+    return response.text
+
+
+def _decode_noaa_table(response: requests.Response) -> Any:
+    """Decode a NOAA product table (list of lists, header row first) into row objects."""
+    payload = response.json()
+    if isinstance(payload, list) and payload and isinstance(payload[0], list):
+        header = payload[0]
+        return [dict(zip(header, row)) for row in payload[1:]]
+    return payload
+
+
+DECODERS: Dict[str, Callable[[requests.Response], Any]] = {
+    'json': _decode_json,
+    'text': _decode_text,
+    'noaa_table': _decode_noaa_table,
+}
+
+
+def _positive_seconds(feed_name: str, setting: str, value: Any) -> float:
+    """Validate a duration setting from feed configuration."""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Feed {feed_name} needs a numeric {setting}, got {value!r}")
+    # Also rejects NaN, which would never compare as due
+    if not seconds > 0:
+        raise ValueError(f"Feed {feed_name} needs a positive {setting}, got {value!r}")
+    return seconds
+
+
+def register_decoder(name: str, decoder: Callable[[requests.Response], Any]):
+    """
+    Register a payload decoder usable from feed configuration.
+
+    Args:
+        name: Decoder name referenced by a feed's 'decoder' setting
+        decoder: Callable taking a requests.Response and returning the payload
+    """
+    DECODERS[name] = decoder
+
+
+class Feed:
+    """
+    A single configured feed and its schedule.
+    """
+
+    def __init__(self, name: str, url: str, source: str, interval: float = 300,
+                 decoder: str = 'json', timeout: float = 30, enabled: bool = True):
+        """
+        Initialize a feed.
+
+        Args:
+            name: Feed identifier (e.g., 'noaa_mag')
+            url: URL to fetch
+            source: Archive source the feed is stored under (e.g., 'solar_wind')
+            interval: Collection cadence in seconds (must be positive)
+            decoder: Name of a registered decoder
+            timeout: Request timeout in seconds (must be positive)
+            enabled: Whether the feed is collected
+        """
+        if decoder not in DECODERS:
+            raise ValueError(f"Unknown decoder '{decoder}' for feed {name}")
+
+        self.name = name
+        self.url = url
+        self.source = source
+        self.interval = _positive_seconds(name, 'interval', interval)
+        self.decoder = decoder
+        self.timeout = _positive_seconds(name, 'timeout', timeout)
+        self.enabled = enabled
+        self.next_due = 0.0
+
+    @classmethod
+    def from_config(cls, spec: Dict, defaults: Dict) -> 'Feed':
+        """
+        Build a feed from a configuration entry.
+
+        Args:
+            spec: Feed entry from collectors.feeds
+            defaults: Fallback values for interval, decoder and timeout
+
+        Returns:
+            Configured feed
+        """
+        missing = [key for key in ('name', 'url', 'source') if not spec.get(key)]
+        if missing:
+            raise ValueError(f"Feed entry {spec} is missing {', '.join(missing)}")
+
+        return cls(
+            name=spec['name'],
+            url=spec['url'],
+            source=spec['source'],
+            interval=spec.get('interval', defaults.get('interval', 300)),
+            decoder=spec.get('decoder', defaults.get('decoder', 'json')),
+            timeout=spec.get('timeout', defaults.get('timeout', 30)),
+            enabled=spec.get('enabled', True)
+        )
+
+    def is_due(self, now: float) -> bool:
+        return self.enabled and now >= self.next_due
+
+    def reschedule(self, now: float):
+        """Schedule the next collection, skipping any missed slots."""
+        if self.next_due == 0.0:
+            self.next_due = now
+        while self.next_due <= now:
+            self.next_due += self.interval
+
+
+class FeedCollector:
+    """
+    Collects an arbitrary list of configured feeds over one shared
+    concurrency budget.
+
+    Feeds are read from the 'collectors.feeds' configuration list; each has
+    its own URL, cadence, decoder and archive source. Due feeds are fetched
+    on a single bounded thread pool and yielded as they complete.
+    """
+
+    def __init__(self, config: Optional[Any] = None):
+        """
+        Initialize the Feed Collector.
+
+        Args:
+            config: ConfigLoader or configuration dictionary containing
+                a 'collectors' section
+        """
+        collectors = (config.get('collectors', {}) if config is not None else {}) or {}
+
+        defaults = {
+            'interval': collectors.get('default_interval', 300),
+            'decoder': collectors.get('default_decoder', 'json'),
+            'timeout': collectors.get('timeout', 30),
+        }
+        self.feeds: List[Feed] = [Feed.from_config(spec, defaults)
+                                  for spec in collectors.get('feeds', []) or []]
+
+        names = [feed.name for feed in self.feeds]
+        duplicates = {name for name in names if names.count(name) > 1}
+        if duplicates:
+            raise ValueError(f"Duplicate feed names: {', '.join(sorted(duplicates))}")
+
+        self.max_concurrency = max(1, int(collectors.get('max_concurrency', 8)))
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_concurrency,
+                              pool_maxsize=self.max_concurrency)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                            thread_name_prefix="luft-feed")
+
+    @property
+    def sources(self) -> List[str]:
+        """Archive sources covered by the enabled feeds."""
+        return sorted({feed.source for feed in self.feeds if feed.enabled})
+
+    def due_feeds(self, now: Optional[float] = None) -> List[Feed]:
+        """
+        Get the feeds whose next collection time has passed.
+
+        Args:
+            now: Monotonic time to check against (defaults to now)
+
+        Returns:
+            List of due feeds
+        """
+        now = time.monotonic() if now is None else now
+        return [feed for feed in self.feeds if feed.is_due(now)]
+
+    def seconds_until_next(self, now: Optional[float] = None) -> float:
+        """
+        Get the time until the next feed is due.
+
+        Args:
+            now: Monotonic time to measure from (defaults to now)
+
+        Returns:
+            Seconds until the next due feed (0 if one is due already)
+        """
+        now = time.monotonic() if now is None else now
+        pending = [feed.next_due for feed in self.feeds if feed.enabled]
+        if not pending:
+            return float('inf')
+        return max(0.0, min(pending) - now)
+
+    def iter_due(self, force: bool = False) -> Iterator[Tuple[Feed, Dict]]:
+        """
+        Collect every due feed concurrently.
+
+        Args:
+            force: Collect all enabled feeds regardless of schedule
+
+        Yields:
+            (feed, entry with status, data and collection timestamp) in
+            completion order
+        """
+        now = time.monotonic()
+        feeds = [feed for feed in self.feeds if feed.enabled] if force else self.due_feeds(now)
+        for feed in feeds:
+            feed.reschedule(now)
+
+        # Keep a bounded number of feeds in flight so completed payloads
+        # do not pile up while the caller is still archiving earlier ones
+        pending_feeds = iter(feeds)
+        in_flight = {}
+        try:
+            while True:
+                while len(in_flight) < self.max_concurrency * 2:
+                    feed = next(pending_feeds, None)
+                    if feed is None:
+                        break
+                    in_flight[self._executor.submit(self._collect_feed, feed)] = feed
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield in_flight.pop(future), future.result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    def collect_due(self, force: bool = False) -> Dict[str, Dict]:
+        """
+        Collect every due feed and group the results by archive source.
+
+        Args:
+            force: Collect all enabled feeds regardless of schedule
+
+        Returns:
+            Mapping of archive source to a collection dictionary shaped like
+            the other collectors' output
+        """
+        collected = {}
+        for feed, entry in self.iter_due(force=force):
+            bundle = collected.setdefault(feed.source, {
+                'timestamp': datetime.utcnow().isoformat(),
+                'sources': {}
+            })
+            bundle['sources'][feed.name] = entry
+        return collected
+
+    def _collect_feed(self, feed: Feed) -> Dict:
+        """
+        Fetch and decode one feed, capturing errors in the entry.
+
+        Args:
+            feed: Feed to collect
+
+        Returns:
+            Feed entry
+        """
+        try:
+            logger.info(f"Collecting data from {feed.name}")
+            response = self._session.get(feed.url, timeout=feed.timeout)
+            response.raise_for_status()
+            data = DECODERS[feed.decoder](response)
+            return {
+                'status': 'success',
+                'data': data,
+                'collected_at': datetime.utcnow().isoformat()
+            }
+        except Exception as e:
+            logger.error(f"Error collecting from {feed.name}: {e}")
+            return {
+                'status': 'error',
+                'error': str(e),
+                'collected_at': datetime.utcnow().isoformat()
+            }
+
+    def close(self):
+        """Release the worker threads and HTTP connections."""
+        self._executor.shutdown(wait=False)
+        self._session.close()
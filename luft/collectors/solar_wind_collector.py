@@ -5,7 +5,7 @@ Collects real-time solar wind data from public APIs
 
 import requests
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,7 +24,7 @@ class SolarWindCollector:
             config: Configuration dictionary with data source URLs
         """
         self.config = config or {}
-        self.sources = {
+        self.sources = self.config.get('sources') or {
             'noaa_swpc': 'https://services.swpc.noaa.gov/json/rtsw/rtsw_wind_1m.json',
             'noaa_mag': 'https://services.swpc.noaa.gov/json/rtsw/rtsw_mag_1m.json',
             'noaa_plasma': 'https://services.swpc.noaa.gov/json/rtsw/rtsw_plasma_1m.json'
@@ -42,24 +42,38 @@ class SolarWindCollector:
             'sources': {}
         }
         
+        for source_name, entry in self.iter_realtime_data():
+            collected_data['sources'][source_name] = entry
+        
+        return collected_data
+    
+    def iter_realtime_data(self) -> Iterator[Tuple[str, Dict]]:
+        """
+        Collect real-time solar wind data one source at a time.
+        
+        Each source's entry is yielded as soon as it is fetched so callers
+        can persist it without holding the other sources in memory.
+        
+        Yields:
+            (source name, entry with status, data and collection timestamp)
+        """
         for source_name, url in self.sources.items():
             try:
                 logger.info(f"Collecting data from {source_name}")
                 data = self._fetch_data(url)
-                collected_data['sources'][source_name] = {
+                entry = {
                     'status': 'success',
                     'data': data,
                     'collected_at': datetime.utcnow().isoformat()
                 }
             except Exception as e:
                 logger.error(f"Error collecting from {source_name}: {e}")
-                collected_data['sources'][source_name] = {
+                entry = {
                     'status': 'error',
                     'error': str(e),
                     'collected_at': datetime.utcnow().isoformat()
                 }
-        
-        return collected_data
+            yield source_name, entry
     
     def _fetch_data(self, url: str, timeout: int = 30) -> Dict:
         """
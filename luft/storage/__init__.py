@@ -2,6 +2,10 @@
 Storage system initialization
 """
 
-from .data_archiver import DataArchiver
+from .data_archiver import DataArchiver, ArchiveStream
+from .archive_server import ArchiveQueryServer
+from .columnar_export import export_columnar, ColumnarReader
+from .retention import RetentionManager
 
-__all__ = ['DataArchiver']
+__all__ = ['DataArchiver', 'ArchiveStream', 'ArchiveQueryServer',
+           'export_columnar', 'ColumnarReader', 'RetentionManager']
@@ -0,0 +1,401 @@
+"""
+Archive Query Server
+Read-only local HTTP service over the data archive with result caching
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+from .data_archiver import DataArchiver
+from ..utils.time_codec import epoch_to_datetime, parse_time_tag
+
+logger = logging.getLogger(__name__)
+
+
+class QueryError(Exception):
+    """Raised when a request cannot be answered."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ArchiveQueryServer:
+    """
+    Serves archive queries over HTTP from a single asyncio process.
+
+    Endpoints (all GET, JSON responses):
+        /health                                  Server and cache statistics
+        /latest?source=S                         Most recent archive package
+        /archives?source=S[&date=YYYY-MM-DD]     Archive file paths
+        /range?source=S&start=T&end=T[&limit=N]  Archive packages in a time range
+
+    Results are cached in-process as serialized (and gzipped) bodies, so
+    cache hits never touch the archive files. Entries for a source are
+    invalidated when a new archive is written for it, in this process or
+    another one: each write touches the source's generation file, which is
+    checked with a single stat per request. Entries also expire after
+    cache_ttl seconds.
+    """
+
+    def __init__(self, archiver: DataArchiver, host: str = "127.0.0.1", port: int = 8765,
+                 cache_size: int = 256, cache_ttl: float = 30.0, workers: int = 8,
+                 compress_min_bytes: int = 1024):
+        """
+        Initialize the query server.
+
+        Args:
+            archiver: Archiver to serve queries from
+            host: Interface to bind
+            port: Port to bind
+            cache_size: Maximum number of cached results
+            cache_ttl: Seconds before a cached result is recomputed
+            workers: Threads used for archive file I/O
+            compress_min_bytes: Minimum body size to gzip
+        """
+        self.archiver = archiver
+        self.host = host
+        self.port = port
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.compress_min_bytes = compress_min_bytes
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="luft-query")
+        self._cache: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self._pending: Dict[Tuple, asyncio.Future] = {}
+        self._generations: Dict[str, int] = {}
+        self._generations_lock = threading.Lock()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.stats = {'requests': 0, 'cache_hits': 0, 'cache_misses': 0}
+
+        self._routes = {
+            '/health': self._query_health,
+            '/latest': self._query_latest,
+            '/archives': self._query_archives,
+            '/range': self._query_range,
+        }
+
+        archiver.add_listener(self._invalidate)
+
+    def _invalidate(self, source: str, filepath: str):
+        """Archiver listener: bump the source generation (called from writer threads)."""
+        with self._generations_lock:
+            self._generations[source] = self._generations.get(source, 0) + 1
+
+    async def start(self):
+        """Start listening for connections."""
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        sockets = self._server.sockets or []
+        if sockets:
+            self.port = sockets[0].getsockname()[1]
+        logger.info(f"Archive query server listening on http://{self.host}:{self.port}")
+
+    async def serve_forever(self):
+        """Start the server and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        """Stop the server and release worker threads."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._executor.shutdown(wait=False)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one connection, honouring keep-alive."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._send(writer, HTTPStatus.BAD_REQUEST,
+                                     self._error_body("Malformed request line"), False, False)
+                    break
+
+                keep_alive = self._keep_alive(version, headers)
+                accepts_gzip = 'gzip' in headers.get('accept-encoding', '')
+
+                if method not in ('GET', 'HEAD'):
+                    status, body, gzipped = HTTPStatus.METHOD_NOT_ALLOWED, \
+                        self._error_body("Only GET is supported"), None
+                else:
+                    status, body, gzipped = await self._dispatch(target)
+
+                if accepts_gzip and gzipped is not None:
+                    payload, encoded = gzipped, True
+                else:
+                    payload, encoded = body, False
+
+                await self._send(writer, status, payload, encoded, keep_alive,
+                                 head_only=(method == 'HEAD'))
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            logger.error(f"Error handling query connection: {e}")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _keep_alive(version: str, headers: Dict[str, str]) -> bool:
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.0':
+            return connection == 'keep-alive'
+        return connection != 'close'
+
+    async def _send(self, writer: asyncio.StreamWriter, status: HTTPStatus, payload: bytes,
+                    gzipped: bool, keep_alive: bool, head_only: bool = False):
+        """Write an HTTP response."""
+        header_lines = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(payload)}",
+            "Vary: Accept-Encoding",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if gzipped:
+            header_lines.append("Content-Encoding: gzip")
+        writer.write(("\r\n".join(header_lines) + "\r\n\r\n").encode('latin-1'))
+        if not head_only:
+            writer.write(payload)
+        await writer.drain()
+
+    async def _dispatch(self, target: str) -> Tuple[HTTPStatus, bytes, Optional[bytes]]:
+        """
+        Resolve a request target to a response, using the cache.
+
+        Returns:
+            (status, JSON body, gzipped body or None if not worth compressing)
+        """
+        self.stats['requests'] += 1
+        url = urlsplit(target)
+        route = url.path.rstrip('/') or '/'
+        handler = self._routes.get(route)
+        if handler is None:
+            return HTTPStatus.NOT_FOUND, self._error_body(f"Unknown endpoint: {url.path}"), None
+
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        if route == '/health':
+            return (HTTPStatus.OK, self._encode(self._query_health(params)), None)
+
+        source = params.get('source')
+        if not source:
+            return HTTPStatus.BAD_REQUEST, self._error_body("Missing 'source' parameter"), None
+        if not self.archiver.has_source(source):
+            return HTTPStatus.BAD_REQUEST, self._error_body(f"Unknown source: {source}"), None
+
+        key = (url.path, tuple(sorted(params.items())))
+        # In-process writes bump the local counter; writes from other
+        # processes (e.g. the runner) update the generation file
+        with self._generations_lock:
+            local_generation = self._generations.get(source, 0)
+        generation = (local_generation, self.archiver.generation_stamp(source))
+
+        cached = self._cache.get(key)
+        if cached and cached['generation'] == generation \
+                and time.monotonic() - cached['created'] < self.cache_ttl:
+            self._cache.move_to_end(key)
+            self.stats['cache_hits'] += 1
+            return cached['status'], cached['body'], cached['gzipped']
+
+        self.stats['cache_misses'] += 1
+
+        # Coalesce concurrent misses for the same query into one computation
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[key] = future
+        try:
+            result = await loop.run_in_executor(self._executor, self._compute, handler, params)
+            status, body, gzipped = result
+            if status == HTTPStatus.OK:
+                self._store(key, generation, result)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else is waiting
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+
+    def _compute(self, handler, params: Dict[str, str]) -> Tuple[HTTPStatus, bytes, Optional[bytes]]:
+        """Run a query handler in a worker thread and serialize the result."""
+        try:
+            body = self._encode(handler(params))
+            status = HTTPStatus.OK
+        except QueryError as e:
+            body = self._error_body(str(e))
+            status = e.status
+        except Exception as e:
+            logger.error(f"Error answering query: {e}")
+            body = self._error_body("Internal error")
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+
+        gzipped = gzip.compress(body, compresslevel=5) if len(body) >= self.compress_min_bytes else None
+        return status, body, gzipped
+
+    def _store(self, key: Tuple, generation: Tuple, result: Tuple):
+        """Insert a result into the LRU cache."""
+        status, body, gzipped = result
+        self._cache[key] = {
+            'status': status,
+            'body': body,
+            'gzipped': gzipped,
+            'generation': generation,
+            'created': time.monotonic()
+        }
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _encode(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    def _error_body(self, message: str) -> bytes:
+        return self._encode({'error': message})
+
+    # Query handlers (run in worker threads, except health)
+
+    def _query_health(self, params: Dict[str, str]) -> Dict:
+        return {
+            'status': 'ok',
+            'archive_path': str(self.archiver.archive_path),
+            'cached_results': len(self._cache),
+            **self.stats
+        }
+
+    def _query_latest(self, params: Dict[str, str]) -> Dict:
+        source = params['source']
+        filepath = self.archiver.latest_archive(source)
+        if filepath is None:
+            raise QueryError(HTTPStatus.NOT_FOUND, f"No archives for source: {source}")
+
+        package = self.archiver.retrieve_data(filepath)
+        if package is None:
+            raise QueryError(HTTPStatus.NOT_FOUND, f"Archive unreadable: {filepath}")
+        return {'source': source, 'path': filepath, 'archive': package}
+
+    def _query_archives(self, params: Dict[str, str]) -> Dict:
+        source = params['source']
+        date = params.get('date')
+        if date:
+            # Same format list_archives accepts; anything else would match nothing
+            try:
+                datetime.strptime(date, "%Y-%m-%d")
+            except ValueError:
+                raise QueryError(HTTPStatus.BAD_REQUEST, f"Invalid 'date' parameter: {date}")
+        archives = sorted(self.archiver.list_archives(source, date))
+        return {'source': source, 'date': date, 'count': len(archives), 'archives': archives}
+
+    def _query_range(self, params: Dict[str, str]) -> Dict:
+        source = params['source']
+        if 'start' not in params or 'end' not in params:
+            raise QueryError(HTTPStatus.BAD_REQUEST, "Missing 'start' or 'end' parameter")
+
+        start = self._parse_time(params['start'], 'start')
+        end = self._parse_time(params['end'], 'end', end_of_day=True)
+        try:
+            limit = int(params.get('limit', 100))
+        except ValueError:
+            raise QueryError(HTTPStatus.BAD_REQUEST, "Invalid 'limit' parameter")
+
+        # Read serially: this already runs on the server's I/O pool, which
+        # spreads concurrent queries across its threads
+        paths = self.archiver.list_archives_range(source, start, end)
+        archives = []
+        for filepath in paths[:limit]:
+            package = self.archiver.retrieve_data(filepath)
+            if package is not None:
+                archives.append({'path': filepath, 'archive': package})
+
+        return {
+            'source': source,
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'total': len(paths),
+            'count': len(archives),
+            'archives': archives
+        }
+
+    @staticmethod
+    def _parse_time(value: str, name: str, end_of_day: bool = False) -> datetime:
+        """Parse a YYYY-MM-DD date or ISO-8601 timestamp query parameter."""
+        try:
+            parsed = epoch_to_datetime(parse_time_tag(value))
+        except (ValueError, OverflowError):
+            raise QueryError(HTTPStatus.BAD_REQUEST, f"Invalid '{name}' parameter: {value}")
+        if end_of_day and len(value) == 10:
+            parsed = parsed.replace(hour=23, minute=59, second=59, microsecond=999999)
+        return parsed
+
+
+def main():
+    """Command-line entry point."""
+    import argparse
+    from ..utils import setup_logging, ConfigLoader
+
+    parser = argparse.ArgumentParser(description='LUFT archive query server')
+    parser.add_argument('--config', default='config/luft_config.yml', help='Configuration file path')
+    parser.add_argument('--host', help='Interface to bind (overrides config)')
+    parser.add_argument('--port', type=int, help='Port to bind (overrides config)')
+    args = parser.parse_args()
+
+    config = ConfigLoader(args.config)
+    setup_logging(log_level=config.get('logging.level', 'INFO'))
+
+    archiver = DataArchiver(config.get('storage.archive_path', 'data/archive'),
+                            cold_path=config.get('storage.cold_path'))
+    server = ArchiveQueryServer(
+        archiver,
+        host=args.host or config.get('server.host', '127.0.0.1'),
+        port=args.port or config.get('server.port', 8765),
+        cache_size=config.get('server.cache_size', 256),
+        cache_ttl=config.get('server.cache_ttl', 30.0),
+        workers=config.get('server.workers', 8)
+    )
+
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        logger.info("Archive query server stopped")
+
+
+if __name__ == '__main__':
+    main()
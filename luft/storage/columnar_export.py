@@ -0,0 +1,517 @@
+"""
+Columnar Export
+Bulk export of archived feed data to self-describing binary columnar files
+"""
+
+import json
+import logging
+import mmap
+import os
+import sys
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .data_archiver import DataArchiver
+from ..utils.time_codec import datetime_to_epoch, parse_time_tags
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the reader falls back to memoryviews
+    np = None
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"LUFTCOL1"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+ARCHIVED_AT_COLUMN = '_archived_at'
+
+# Text columns stored as timestamp[us] when every value parses as a time tag
+TIME_TAG_COLUMNS = ('time_tag',)
+
+# Column type -> (array typecode, numpy dtype, item size)
+FIXED_TYPES = {
+    'bool': ('B', 'u1', 1),
+    'int64': ('q', 'i8', 8),
+    'float64': ('d', 'f8', 8),
+    'timestamp[us]': ('q', 'i8', 8),
+}
+
+# Promotion order when a column holds mixed value types
+TYPE_RANK = {'bool': 0, 'int64': 1, 'float64': 2, 'utf8': 3}
+
+# File layout (integers use the writer's byte order, recorded in the header):
+#
+#     8 bytes   magic  b"LUFTCOL1"
+#     8 bytes   header length (uint64, little-endian)
+#     N bytes   header (UTF-8 JSON), padded to a 64-byte boundary
+#     ...       column buffers, each starting on a 64-byte boundary
+#
+# Buffer offsets in the header are relative to the start of the data section.
+# Fixed-width columns have a 'values' buffer; utf8 columns have 'offsets'
+# (int64, rows + 1 entries) and 'data' buffers. Columns containing nulls also
+# have a 'validity' buffer with one byte per row (1 = valid). Null floats are
+# stored as NaN.
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _value_type(value: Any) -> Optional[str]:
+    """Classify a JSON value into a column type (None for null)."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, int):
+        return 'int64'
+    if isinstance(value, float):
+        return 'float64'
+    return 'utf8'
+
+
+def _to_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, separators=(',', ':'))
+
+
+def _payload_rows(payload: Any) -> List[Dict]:
+    """
+    Normalize a feed payload into a list of row dictionaries.
+
+    NOAA JSON products are either a list of objects or a list of lists whose
+    first row holds the column names.
+    """
+    if not isinstance(payload, list) or not payload:
+        return []
+    first = payload[0]
+    if isinstance(first, dict):
+        return [row for row in payload if isinstance(row, dict)]
+    if isinstance(first, list) and all(isinstance(name, str) for name in first):
+        return [dict(zip(first, row)) for row in payload[1:] if isinstance(row, list)]
+    return []
+
+
+def iter_feed_rows(archiver: DataArchiver, source: str, feed: str,
+                   start: datetime, end: datetime,
+                   paths: Optional[List[str]] = None) -> Iterator[Tuple[datetime, List[Dict]]]:
+    """
+    Iterate over the rows of one feed across archives in a time range.
+
+    Handles both bundled archives and streaming manifests. Archives are
+    prefetched a few at a time, in order.
+
+    Args:
+        archiver: Archiver to read from
+        source: Source identifier (e.g., 'solar_wind')
+        feed: Feed name within the source (e.g., 'noaa_mag')
+        start: Range start (UTC)
+        end: Range end (UTC, inclusive)
+        paths: Archive paths to read instead of listing the range again
+
+    Yields:
+        (archive timestamp, list of row dictionaries)
+    """
+    if paths is None:
+        paths = archiver.list_archives_range(source, start, end)
+    for filepath, package in archiver.retrieve_many(paths, workers=4):
+        if not package:
+            continue
+        archived_at = archiver._archive_time(filepath)
+
+        entry = package.get('data', {}).get('sources', {}).get(feed)
+        if not entry or entry.get('status') != 'success':
+            continue
+
+        if package.get('mode') == 'stream':
+            feed_package = archiver.retrieve_data(str(Path(filepath).parent / entry['file']))
+            if not feed_package:
+                continue
+            entry = feed_package['data']
+
+        rows = _payload_rows(entry.get('data'))
+        if rows:
+            yield archived_at, rows
+
+
+class _ColumnPlan:
+    """Schema and size information for one column, gathered in the first pass."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.type: Optional[str] = None
+        self.nulls = 0
+        self.text_bytes = 0
+        self.time_tags = name in TIME_TAG_COLUMNS
+
+    def observe(self, value: Any):
+        value_type = _value_type(value)
+        if value_type is None:
+            self.nulls += 1
+            return
+        if self.type is None or TYPE_RANK[value_type] > TYPE_RANK[self.type]:
+            self.type = value_type
+        # Measured for every value since a later value may promote the
+        # column to utf8; this avoids another pass over the archives.
+        self.text_bytes += len(_to_text(value).encode())
+
+
+def export_columnar(archiver: DataArchiver, output_path: str, source: str, feed: str,
+                    start: datetime, end: datetime) -> Dict:
+    """
+    Export one feed over a time range to a binary columnar file.
+
+    Makes two passes over the archives: the first infers the schema and
+    buffer sizes, the second writes each archive's rows straight to their
+    final offsets. Memory use is bounded by a few archives at a time.
+    Rows with their own '_archived_at' field are rejected with ValueError,
+    since that name is reserved for the archive time column.
+
+    Args:
+        archiver: Archiver to read from
+        output_path: Destination file path
+        source: Source identifier (e.g., 'solar_wind')
+        feed: Feed name within the source (e.g., 'noaa_mag')
+        start: Range start (UTC)
+        end: Range end (UTC, inclusive)
+
+    Returns:
+        File header describing the export
+    """
+    # Both passes read the same archive list, so archives written during
+    # the export cannot change the planned layout
+    paths = archiver.list_archives_range(source, start, end)
+
+    # Pass 1: schema inference
+    plans: Dict[str, _ColumnPlan] = {}
+    num_rows = 0
+    num_archives = 0
+    for _, rows in iter_feed_rows(archiver, source, feed, start, end, paths):
+        num_archives += 1
+        for row in rows:
+            for name in row:
+                if name not in plans:
+                    if name == ARCHIVED_AT_COLUMN:
+                        raise ValueError(f"Feed {feed} has a '{ARCHIVED_AT_COLUMN}' field, "
+                                         f"which collides with the archive time column")
+                    plan = _ColumnPlan(name)
+                    # Rows seen before this column first appeared are null
+                    plan.nulls = num_rows
+                    plans[name] = plan
+            for name, plan in plans.items():
+                plan.observe(row.get(name))
+            num_rows += 1
+
+        for plan in plans.values():
+            if plan.time_tags:
+                try:
+                    parse_time_tags([row.get(plan.name) for row in rows])
+                except (ValueError, TypeError, AttributeError):
+                    plan.time_tags = False
+
+    for plan in plans.values():
+        if plan.type is None:
+            plan.type = 'utf8'
+        elif plan.type == 'utf8' and plan.time_tags:
+            plan.type = 'timestamp[us]'
+
+    # Layout
+    columns = [{'name': ARCHIVED_AT_COLUMN, 'type': 'timestamp[us]', 'nulls': 0, 'buffers': {}}]
+    columns += [{'name': plan.name, 'type': plan.type, 'nulls': plan.nulls, 'buffers': {}}
+                for plan in plans.values()]
+
+    offset = 0
+    for column in columns:
+        sizes = {}
+        if column['type'] == 'utf8':
+            sizes['offsets'] = (num_rows + 1) * 8
+            sizes['data'] = plans[column['name']].text_bytes
+        else:
+            sizes['values'] = num_rows * FIXED_TYPES[column['type']][2]
+        if column['nulls']:
+            sizes['validity'] = num_rows
+        for buffer_name, size in sizes.items():
+            offset = _align(offset)
+            column['buffers'][buffer_name] = {'offset': offset, 'length': size}
+            offset += size
+    data_length = _align(offset)
+
+    header = {
+        'format': 'luft-columnar',
+        'version': FORMAT_VERSION,
+        'byteorder': sys.byteorder,
+        'source': source,
+        'feed': feed,
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'created_at': datetime.utcnow().isoformat(),
+        'archives': num_archives,
+        'rows': num_rows,
+        'columns': columns
+    }
+    header_bytes = json.dumps(header).encode()
+    data_start = _align(len(MAGIC) + 8 + len(header_bytes))
+
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_output = output.with_name(output.name + '.tmp')
+
+    # Pass 2: write rows chunk by chunk at their final offsets, into a
+    # temporary file that only replaces the output once complete
+    try:
+        with open(tmp_output, 'wb') as f:
+            f.write(MAGIC)
+            f.write(len(header_bytes).to_bytes(8, 'little'))
+            f.write(header_bytes)
+            f.truncate(data_start + data_length)
+
+            def write_at(buffer: Dict, position: int, payload: bytes):
+                f.seek(data_start + buffer['offset'] + position)
+                f.write(payload)
+
+            row_cursor = 0
+            text_cursors = {column['name']: 0 for column in columns if column['type'] == 'utf8'}
+            for column in columns:
+                if column['type'] == 'utf8':
+                    write_at(column['buffers']['offsets'], 0, array('q', [0]).tobytes())
+
+            for archived_at, rows in iter_feed_rows(archiver, source, feed, start, end, paths):
+                count = len(rows)
+                if row_cursor + count > num_rows:
+                    raise RuntimeError(f"Archive changed during export: more than {num_rows} rows")
+                for column in columns:
+                    name = column['name']
+                    column_type = column['type']
+                    buffers = column['buffers']
+
+                    if name == ARCHIVED_AT_COLUMN:
+                        values = array('q', [datetime_to_epoch(archived_at)]) * count
+                        write_at(buffers['values'], row_cursor * 8, values.tobytes())
+                        continue
+
+                    raw = [row.get(name) for row in rows]
+                    if 'validity' in buffers:
+                        validity = bytes(0 if value is None else 1 for value in raw)
+                        write_at(buffers['validity'], row_cursor, validity)
+
+                    if column_type == 'utf8':
+                        encoded = [b'' if value is None else _to_text(value).encode() for value in raw]
+                        ends = array('q')
+                        cursor = text_cursors[name]
+                        for item in encoded:
+                            cursor += len(item)
+                            ends.append(cursor)
+                        write_at(buffers['offsets'], (row_cursor + 1) * 8, ends.tobytes())
+                        write_at(buffers['data'], text_cursors[name], b''.join(encoded))
+                        text_cursors[name] = cursor
+                    elif column_type == 'timestamp[us]':
+                        values = parse_time_tags(raw)
+                        write_at(buffers['values'], row_cursor * 8, values.tobytes())
+                    else:
+                        typecode, _, itemsize = FIXED_TYPES[column_type]
+                        if column_type == 'float64':
+                            fill = float('nan')
+                            values = array(typecode, (fill if v is None else float(v) for v in raw))
+                        else:
+                            values = array(typecode, (0 if v is None else int(v) for v in raw))
+                        write_at(buffers['values'], row_cursor * itemsize, values.tobytes())
+
+                row_cursor += count
+
+        if row_cursor != num_rows:
+            raise RuntimeError(f"Archive changed during export: expected {num_rows} rows, "
+                               f"wrote {row_cursor}")
+        os.replace(tmp_output, output)
+    except BaseException:
+        if tmp_output.exists():
+            tmp_output.unlink()
+        raise
+
+    logger.info(f"Exported {num_rows} rows from {num_archives} archives of {source}/{feed} to {output}")
+    return header
+
+
+class Utf8Column:
+    """Read-only, lazily decoded view of a utf8 column."""
+
+    def __init__(self, offsets, data: memoryview):
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("column index out of range")
+        return bytes(self._data[self._offsets[index]:self._offsets[index + 1]]).decode()
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+class ColumnarReader:
+    """
+    Memory-mapped reader for columnar export files.
+
+    Opening a file only parses its header; column buffers are exposed as
+    read-only views into the mapping (NumPy arrays when NumPy is installed,
+    memoryviews otherwise), so multi-GB exports open instantly and the page
+    cache is shared between processes reading the same file. Readers pickle
+    by path, so they can be handed to worker processes.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a columnar export file.
+
+        Args:
+            path: Path to the export file
+        """
+        self.path = str(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty columnar file: {self.path}")
+        self._view = memoryview(self._mmap)
+
+        if self._view[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Not a LUFT columnar file: {self.path}")
+
+        header_length = int.from_bytes(self._view[len(MAGIC):len(MAGIC) + 8], 'little')
+        header_end = len(MAGIC) + 8 + header_length
+        self.header = json.loads(bytes(self._view[len(MAGIC) + 8:header_end]))
+        self._data_start = _align(header_end)
+
+        if self.header.get('byteorder') != sys.byteorder:
+            self.close()
+            raise ValueError(f"Columnar file byte order {self.header.get('byteorder')} "
+                             f"does not match host {sys.byteorder}")
+
+        self._columns = {column['name']: column for column in self.header['columns']}
+        if len(self._columns) != len(self.header['columns']):
+            self.close()
+            raise ValueError(f"Columnar file has duplicate column names: {self.path}")
+
+    @property
+    def num_rows(self) -> int:
+        return self.header['rows']
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self._columns)
+
+    def schema(self) -> Dict[str, str]:
+        """Column name to column type mapping."""
+        return {name: column['type'] for name, column in self._columns.items()}
+
+    def _buffer(self, column: Dict, buffer_name: str) -> memoryview:
+        buffer = column['buffers'][buffer_name]
+        start = self._data_start + buffer['offset']
+        return self._view[start:start + buffer['length']]
+
+    def _typed(self, view: memoryview, typecode: str, dtype: str):
+        if np is not None:
+            return np.frombuffer(view, dtype=dtype)
+        return view.cast(typecode)
+
+    def column(self, name: str):
+        """
+        Get a zero-copy view of a column's values.
+
+        Args:
+            name: Column name
+
+        Returns:
+            NumPy array or memoryview for fixed-width columns, Utf8Column
+            for text columns
+        """
+        column = self._columns[name]
+        if column['type'] == 'utf8':
+            offsets = self._typed(self._buffer(column, 'offsets'), 'q', 'i8')
+            return Utf8Column(offsets, self._buffer(column, 'data'))
+
+        typecode, dtype, _ = FIXED_TYPES[column['type']]
+        if column['type'] == 'bool' and np is not None:
+            dtype = '?'
+        return self._typed(self._buffer(column, 'values'), typecode, dtype)
+
+    def validity(self, name: str):
+        """
+        Get a column's validity mask (1 = valid, 0 = null).
+
+        Args:
+            name: Column name
+
+        Returns:
+            Zero-copy mask, or None if the column has no nulls
+        """
+        column = self._columns[name]
+        if 'validity' not in column['buffers']:
+            return None
+        return self._typed(self._buffer(column, 'validity'), 'B', 'u1')
+
+    def __getitem__(self, name: str):
+        return self.column(name)
+
+    def close(self):
+        """Release the mapping and file handle."""
+        # Views handed out keep the mapping alive until they are released
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self) -> 'ColumnarReader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def __reduce__(self):
+        return (self.__class__, (self.path,))
+
+
+def main():
+    """Command-line entry point."""
+    import argparse
+    from ..utils import setup_logging, ConfigLoader
+
+    parser = argparse.ArgumentParser(description='Export archived feed data to a columnar file')
+    parser.add_argument('--config', default='config/luft_config.yml', help='Configuration file path')
+    parser.add_argument('--source', required=True, help="Source identifier (e.g. 'solar_wind')")
+    parser.add_argument('--feed', required=True, help="Feed name (e.g. 'noaa_mag')")
+    parser.add_argument('--start', required=True, help='Range start (YYYY-MM-DD or ISO-8601)')
+    parser.add_argument('--end', required=True, help='Range end, inclusive (YYYY-MM-DD or ISO-8601)')
+    parser.add_argument('--output', required=True, help='Output file path (e.g. export.luftcol)')
+    args = parser.parse_args()
+
+    config = ConfigLoader(args.config)
+    setup_logging(log_level=config.get('logging.level', 'INFO'))
+    archiver = DataArchiver(config.get('storage.archive_path', 'data/archive'),
+                            cold_path=config.get('storage.cold_path'))
+
+    start = datetime.fromisoformat(args.start)
+    end = datetime.fromisoformat(args.end)
+    if len(args.end) == 10:
+        end = end.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+    header = export_columnar(archiver, args.output, args.source, args.feed, start, end)
+    print(f"Exported {header['rows']} rows ({len(header['columns'])} columns) to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,13 +3,27 @@ Data Archiver
 Archives collected data with proper versioning and metadata
 """
 
+import gzip
 import json
-from datetime import datetime
+import mmap
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterable, Iterator, Tuple, Callable, List
 import logging
 import hashlib
 
+from .write_ahead_log import WriteAheadLog
+from ..utils.time_codec import datetime_to_epoch, epoch_to_datetime
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard json module is used instead
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,15 +33,133 @@ class DataArchiver:
     Ensures reproducibility through proper versioning and metadata.
     """
     
-    def __init__(self, archive_path: str = "data/archive"):
+    WAL_DIR = ".wal"
+    MMAP_THRESHOLD = 1 << 20
+    
+    COLD_SUFFIX = ".gz"
+    GENERATION_FILE = ".generation"
+    
+    def __init__(self, archive_path: str = "data/archive", wal: bool = False,
+                 commit_interval: float = 0.05, commit_bytes: int = 1 << 20,
+                 checkpoint_bytes: int = 64 << 20, cold_path: Optional[str] = None):
         """
         Initialize the Data Archiver.
         
         Args:
             archive_path: Base path for data archive
+            wal: Route writes through a write-ahead log with group commit
+            commit_interval: Maximum seconds a group commit stays open for
+                more writes
+            commit_bytes: Pending log bytes that trigger an immediate group commit
+            checkpoint_bytes: Log size after which applied writes are synced
+                and the log is truncated
+            cold_path: Base path of the compressed cold tier, if any. Files
+                there mirror the archive layout with a '.gz' suffix.
         """
         self.archive_path = Path(archive_path)
         self.archive_path.mkdir(parents=True, exist_ok=True)
+        self.cold_path = Path(cold_path) if cold_path else None
+        self._listeners: List[Callable[[str, str], None]] = []
+        
+        self._wal: Optional[WriteAheadLog] = None
+        if wal:
+            self.checkpoint_bytes = checkpoint_bytes
+            self._wal_lock = threading.Lock()
+            self._wal_idle = threading.Condition(self._wal_lock)
+            self._wal_inflight = 0
+            self._wal_checkpoint_due = False
+            self._wal_applied: List[Path] = []
+            self._wal = WriteAheadLog(self.archive_path / self.WAL_DIR / "archive.wal",
+                                      commit_interval=commit_interval,
+                                      commit_bytes=commit_bytes)
+            recovered = self._wal.replay(self._replay_record)
+            if recovered:
+                logger.info(f"Recovered {recovered} archive writes from the write-ahead log")
+            self.checkpoint()
+    
+    def close(self):
+        """
+        Flush pending writes. In write-ahead log mode this checkpoints and
+        closes the log.
+        """
+        if self._wal is not None:
+            self.checkpoint()
+            self._wal.close()
+            self._wal = None
+    
+    def add_listener(self, callback: Callable[[str, str], None]):
+        """
+        Register a callback invoked after every new archive.
+        
+        Args:
+            callback: Called with (source, archive file path)
+        """
+        self._listeners.append(callback)
+    
+    def _notify(self, source: str, filepath: str):
+        """
+        Notify listeners that a new archive was written.
+        
+        Also touches the source's generation file so readers in other
+        processes can detect the change.
+        
+        Args:
+            source: Source identifier
+            filepath: Archive file path
+        """
+        self.touch_generation(source)
+        for callback in self._listeners:
+            try:
+                callback(source, filepath)
+            except Exception as e:
+                logger.error(f"Error in archive listener: {e}")
+    
+    def touch_generation(self, source: str):
+        """
+        Mark a source's archive contents as changed.
+        
+        Args:
+            source: Source identifier
+        """
+        generation_file = self.archive_path / source / self.GENERATION_FILE
+        try:
+            generation_file.parent.mkdir(parents=True, exist_ok=True)
+            generation_file.touch()
+        except OSError as e:
+            logger.error(f"Error updating generation file for {source}: {e}")
+    
+    def generation_stamp(self, source: str) -> int:
+        """
+        Get a value that changes whenever the source's archives change,
+        including changes made by other processes.
+        
+        Args:
+            source: Source identifier
+            
+        Returns:
+            Modification time of the generation file in nanoseconds, or 0
+        """
+        try:
+            return (self.archive_path / source / self.GENERATION_FILE).stat().st_mtime_ns
+        except OSError:
+            return 0
+    
+    def has_source(self, source: str) -> bool:
+        """
+        Check that a source name is safe and has archives on either tier.
+        
+        Args:
+            source: Source identifier
+            
+        Returns:
+            True if source is a plain name of a directory directly under
+            the archive or cold tier root
+        """
+        if not source or '/' in source or '\\' in source or '..' in source \
+                or source.startswith('.'):
+            return False
+        tiers = [self.archive_path] + ([self.cold_path] if self.cold_path else [])
+        return any((tier / source).is_dir() for tier in tiers)
         
     def archive_data(self, data: Dict, source: str, metadata: Optional[Dict] = None) -> str:
         """
@@ -61,14 +193,203 @@ class DataArchiver:
         
         # Write to file
         try:
-            with open(filepath, 'w') as f:
-                json.dump(archive_package, f, indent=2)
+            self._write_package(filepath, archive_package)
             logger.info(f"Data archived to {filepath}")
+            self._notify(source, str(filepath))
             return str(filepath)
         except Exception as e:
             logger.error(f"Error archiving data: {e}")
             raise
     
+    def open_stream(self, source: str, metadata: Optional[Dict] = None) -> 'ArchiveStream':
+        """
+        Open a streaming archive cycle for a source.
+        
+        Each feed written to the stream is persisted to its own file as soon
+        as it arrives and the cycle manifest is rewritten to index it;
+        closing the stream marks the manifest complete.
+        
+        Args:
+            source: Source identifier (e.g., 'solar_wind', 'cosmic')
+            metadata: Additional metadata to include in the manifest
+            
+        Returns:
+            Open ArchiveStream
+        """
+        return ArchiveStream(self, source, metadata)
+    
+    def archive_stream(self, feeds: Iterable[Tuple[str, Dict]], source: str,
+                       metadata: Optional[Dict] = None) -> str:
+        """
+        Archive feeds one at a time as they are produced.
+        
+        Args:
+            feeds: Iterable of (feed name, feed entry) pairs
+            source: Source identifier (e.g., 'solar_wind', 'cosmic')
+            metadata: Additional metadata to include in the manifest
+            
+        Returns:
+            Manifest file path
+        """
+        with self.open_stream(source, metadata) as stream:
+            for feed_name, entry in feeds:
+                stream.write(feed_name, entry)
+        return stream.manifest_path
+    
+    def iter_stream(self, manifest_path: str) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """
+        Iterate over the feed packages referenced by a stream manifest.
+        
+        Feeds are loaded lazily, one at a time.
+        
+        Args:
+            manifest_path: Path to the stream manifest
+            
+        Yields:
+            (feed name, feed archive package or None if unavailable)
+        """
+        manifest = self.retrieve_data(manifest_path)
+        if not manifest:
+            return
+        
+        base_path = Path(manifest_path).parent
+        for feed_name, index_entry in manifest['data']['sources'].items():
+            feed_file = index_entry.get('file')
+            if not feed_file:
+                yield feed_name, None
+                continue
+            yield feed_name, self.retrieve_data(str(base_path / feed_file))
+    
+    def wait_durable(self, lsn: Optional[int]):
+        """
+        Block until writes made with durable=False are crash-safe.
+        No-op unless write-ahead logging is enabled.
+        
+        Args:
+            lsn: Sequence number returned by the last deferred write
+        """
+        if self._wal is not None and lsn:
+            self._wal.wait_durable(lsn)
+    
+    def _write_package(self, filepath: Path, archive_package: Dict,
+                       durable: bool = True) -> Optional[int]:
+        """
+        Write an archive package to disk.
+        
+        Args:
+            filepath: Destination file path
+            archive_package: Archive package to write
+            durable: In write-ahead log mode, wait for the log record to be
+                durable before returning. With False the file is written
+                at once and durability is deferred to wait_durable().
+            
+        Returns:
+            Write-ahead log sequence number, or None without a log
+        """
+        if self._wal is None:
+            # Replace atomically: stream manifests are rewritten in place
+            # while readers may be loading them
+            tmp_path = Path(filepath).with_name(Path(filepath).name + ".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(archive_package, f, indent=2)
+            os.replace(tmp_path, filepath)
+            return None
+        
+        # Log first, then apply. A durable write's record is on disk before
+        # the archive file appears, so a crash in between is repaired by
+        # replay; a deferred write is covered once wait_durable() returns.
+        body = json.dumps(archive_package, indent=2).encode()
+        relative_path = Path(filepath).relative_to(self.archive_path).as_posix()
+        
+        with self._wal_idle:
+            # Hold new writes back while a due checkpoint waits for the
+            # writes in flight, so the log cannot grow without bound
+            while self._wal_checkpoint_due:
+                self._wal_idle.wait()
+            self._wal_inflight += 1
+        try:
+            lsn = self._wal.append(relative_path, body)
+            if durable:
+                self._wal.wait_durable(lsn)
+            self._apply_record(relative_path, body)
+        finally:
+            with self._wal_idle:
+                self._wal_inflight -= 1
+                self._wal_applied.append(Path(filepath))
+                if self._wal.size >= self.checkpoint_bytes:
+                    self._wal_checkpoint_due = True
+                if self._wal_checkpoint_due and self._wal_inflight == 0:
+                    self._run_due_checkpoint()
+        return lsn
+    
+    def _apply_record(self, relative_path: str, body: bytes):
+        """
+        Write a logged record into the archive layout.
+        
+        The file is replaced atomically so readers never see partial JSON.
+        
+        Args:
+            relative_path: Destination path relative to the archive root
+            body: File contents
+        """
+        filepath = self.archive_path / relative_path
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = filepath.with_name(filepath.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, filepath)
+    
+    def _replay_record(self, relative_path: str, body: bytes):
+        """Apply a record found in the log at startup."""
+        self._apply_record(relative_path, body)
+        self._wal_applied.append(self.archive_path / relative_path)
+    
+    def checkpoint(self):
+        """
+        Make applied write-ahead log records durable in the archive and
+        truncate the log. If writes are in flight, the last of them runs
+        the checkpoint instead. No-op unless write-ahead logging is enabled.
+        """
+        if self._wal is None:
+            return
+        with self._wal_idle:
+            self._wal_checkpoint_due = True
+            if self._wal_inflight == 0:
+                self._run_due_checkpoint()
+    
+    def _run_due_checkpoint(self):
+        """Run a pending checkpoint and release held-back writes (lock held)."""
+        try:
+            self._checkpoint_locked()
+        finally:
+            self._wal_checkpoint_due = False
+            self._wal_idle.notify_all()
+    
+    def _checkpoint_locked(self):
+        """Checkpoint with the WAL lock held and no writes in flight."""
+        directories = set()
+        for filepath in self._wal_applied:
+            self._fsync_path(filepath)
+            directories.add(filepath.parent)
+        for directory in directories:
+            self._fsync_path(directory)
+        self._wal_applied = []
+        self._wal.truncate()
+    
+    @staticmethod
+    def _fsync_path(path: Path):
+        """fsync a file or directory, ignoring platforms that cannot."""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
     def retrieve_data(self, filepath: str) -> Optional[Dict]:
         """
         Retrieve archived data from file.
@@ -80,8 +401,7 @@ class DataArchiver:
             Archived data package or None if not found
         """
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
+            return self._read_package(filepath)
         except FileNotFoundError:
             logger.error(f"Archive file not found: {filepath}")
             return None
@@ -89,6 +409,163 @@ class DataArchiver:
             logger.error(f"Error retrieving data: {e}")
             return None
     
+    def retrieve_many(self, paths: Iterable[str], workers: int = 8, ordered: bool = True,
+                      verify: bool = False) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """
+        Retrieve many archived files concurrently.
+        
+        Files are read and decoded on a bounded thread pool with at most
+        twice as many files in flight as workers, so memory stays bounded
+        however many paths are requested. With orjson installed, large files
+        are memory-mapped rather than read into an intermediate buffer.
+        
+        Args:
+            paths: Archive file paths (e.g., from list_archives)
+            workers: Number of reader threads
+            ordered: Yield results in input order (True) or as completed (False)
+            verify: Verify checksums in the reader threads; packages that
+                fail verification are yielded as None
+            
+        Yields:
+            (path, archived data package or None if unavailable)
+        """
+        workers = max(1, workers)
+        window = workers * 2
+        pending_paths = iter(paths)
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="luft-retrieve") as executor:
+            def submit() -> bool:
+                filepath = next(pending_paths, None)
+                if filepath is None:
+                    return False
+                in_flight.append((filepath, executor.submit(self._load_checked, filepath, verify)))
+                return True
+            
+            in_flight = deque()
+            while len(in_flight) < window and submit():
+                pass
+            
+            try:
+                if ordered:
+                    while in_flight:
+                        filepath, future = in_flight.popleft()
+                        submit()
+                        yield filepath, future.result()
+                else:
+                    while in_flight:
+                        done, _ = wait([future for _, future in in_flight],
+                                       return_when=FIRST_COMPLETED)
+                        finished = [item for item in in_flight if item[1] in done]
+                        for item in finished:
+                            in_flight.remove(item)
+                            submit()
+                        for filepath, future in finished:
+                            yield filepath, future.result()
+            finally:
+                for _, future in in_flight:
+                    future.cancel()
+    
+    def iter_archives(self, source: str, start: datetime, end: datetime,
+                      **kwargs) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """
+        Retrieve every archive for a source in a time range concurrently.
+        
+        Args:
+            source: Source identifier
+            start: Range start (UTC)
+            end: Range end (UTC, inclusive)
+            **kwargs: Passed to retrieve_many()
+            
+        Yields:
+            (path, archived data package or None if unavailable)
+        """
+        return self.retrieve_many(self.list_archives_range(source, start, end), **kwargs)
+    
+    def _load_checked(self, filepath: str, verify: bool) -> Optional[Dict]:
+        """
+        Load one package for retrieve_many(), optionally verifying it.
+        
+        Args:
+            filepath: Path to archived data file
+            verify: Verify the package checksum
+            
+        Returns:
+            Archived data package or None if unavailable or corrupt
+        """
+        package = self.retrieve_data(filepath)
+        if package is None or not verify:
+            return package
+        if package.get('checksum') != self._calculate_checksum(package.get('data')):
+            logger.warning(f"Data integrity check failed: {filepath}")
+            return None
+        return package
+    
+    def _read_package(self, filepath: str) -> Dict:
+        """
+        Read and decode an archive file.
+        
+        With orjson installed, files of MMAP_THRESHOLD bytes or more are
+        memory-mapped and decoded straight from the mapping without a copy.
+        Other files are read in one call. Cold tier files are decompressed
+        in memory.
+        
+        Args:
+            filepath: Path to archived data file
+            
+        Returns:
+            Archived data package
+        """
+        filepath = self._resolve_path(filepath)
+        if filepath.endswith(self.COLD_SUFFIX):
+            with gzip.open(filepath, 'rb') as f:
+                return self._decode_json(f.read())
+        
+        with open(filepath, 'rb') as f:
+            # Without orjson the mapping would be copied before decoding
+            if orjson is None or os.fstat(f.fileno()).st_size < self.MMAP_THRESHOLD:
+                return self._decode_json(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+    
+    def _resolve_path(self, filepath: str) -> str:
+        """
+        Locate an archive file on either storage tier.
+        
+        Paths recorded before a file moved to the cold tier (including
+        feed paths derived from stream manifests) are mapped to the
+        compressed cold copy.
+        
+        Args:
+            filepath: Archive file path on either tier (str or path-like)
+            
+        Returns:
+            Path of the existing file, or the original path if none exists
+        """
+        filepath = os.fspath(filepath)
+        if os.path.exists(filepath):
+            return filepath
+        
+        candidates = [filepath + self.COLD_SUFFIX]
+        if self.cold_path is not None:
+            try:
+                relative = Path(filepath).relative_to(self.archive_path)
+                candidates.append(str(self.cold_path / relative) + self.COLD_SUFFIX)
+            except ValueError:
+                pass
+        
+        for candidate in candidates:
+            if os.path.exists(candidate):
+                return candidate
+        return filepath
+    
+    @staticmethod
+    def _decode_json(raw: bytes) -> Any:
+        """Decode JSON bytes with orjson when available."""
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    
     def verify_integrity(self, archive_package: Dict) -> bool:
         """
         Verify data integrity using checksum.
@@ -133,20 +610,269 @@ class DataArchiver:
         Returns:
             List of archive file paths
         """
-        source_path = self.archive_path / source
-        
-        if not source_path.exists():
-            return []
-        
         if date:
             try:
                 dt = datetime.strptime(date, "%Y-%m-%d")
-                date_path = source_path / dt.strftime("%Y/%m/%d")
-                if date_path.exists():
-                    return [str(f) for f in date_path.glob("*.json")]
             except ValueError:
                 logger.error(f"Invalid date format: {date}")
                 return []
+            pattern = dt.strftime("%Y/%m/%d") + "/*.json"
+        else:
+            # Only files directly in a YYYY/MM/DD directory are archives;
+            # streamed feed files live one level deeper and are reached
+            # through their manifest.
+            pattern = "*/*/*/*.json"
+        
+        archives = []
+        hot_names = set()
+        source_path = self.archive_path / source
+        if source_path.exists():
+            for f in source_path.glob(pattern):
+                archives.append(str(f))
+                hot_names.add(f.relative_to(source_path).as_posix())
+        
+        # Cold tier files, skipping any still present on the hot tier while
+        # they are being moved
+        cold_source_path = self.cold_path / source if self.cold_path else None
+        if cold_source_path is not None and cold_source_path.exists():
+            for f in cold_source_path.glob(pattern + self.COLD_SUFFIX):
+                name = f.relative_to(cold_source_path).as_posix()[:-len(self.COLD_SUFFIX)]
+                if name not in hot_names:
+                    archives.append(str(f))
+        
+        return archives
+    
+    def latest_archive(self, source: str) -> Optional[str]:
+        """
+        Find the most recent archive for a source.
+        
+        Walks the YYYY/MM/DD hierarchy newest-first so only the latest
+        populated day directory is listed.
+        
+        Args:
+            source: Source identifier
+            
+        Returns:
+            Latest archive file path or None if the source has no archives
+        """
+        def _subdirs(path: Path) -> list:
+            return sorted((d for d in path.iterdir() if d.is_dir()), reverse=True)
+        
+        tiers = [(self.archive_path / source, "*.json")]
+        if self.cold_path:
+            tiers.append((self.cold_path / source, "*.json" + self.COLD_SUFFIX))
+        
+        # The hot tier always holds the newest data, so the cold tier is
+        # only consulted when the hot tier is empty
+        for source_path, pattern in tiers:
+            if not source_path.exists():
+                continue
+            for year in _subdirs(source_path):
+                for month in _subdirs(year):
+                    for day in _subdirs(month):
+                        archives = sorted(day.glob(pattern))
+                        if archives:
+                            return str(archives[-1])
+        return None
+    
+    def list_archives_range(self, source: str, start: datetime, end: datetime) -> list:
+        """
+        List archives for a source whose timestamp falls in [start, end].
+        
+        Args:
+            source: Source identifier
+            start: Range start (UTC)
+            end: Range end (UTC, inclusive)
+            
+        Returns:
+            Archive file paths sorted by time
+        """
+        start_epoch = datetime_to_epoch(start)
+        end_epoch = datetime_to_epoch(end)
+        
+        results = []
+        day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        while day <= end:
+            for filepath in self.list_archives(source, day.strftime("%Y-%m-%d")):
+                archived_at = self._archive_epoch(filepath)
+                if archived_at is not None and start_epoch <= archived_at <= end_epoch:
+                    results.append((archived_at, filepath))
+            day += timedelta(days=1)
+        
+        return [filepath for _, filepath in sorted(results)]
+    
+    def _archive_time(self, filepath: str) -> Optional[datetime]:
+        """
+        Parse the archive timestamp encoded in an archive filename.
         
-        # Return all archives if no date specified
-        return [str(f) for f in source_path.rglob("*.json")]
+        Args:
+            filepath: Archive file path
+            
+        Returns:
+            Archive timestamp or None if the name is not a timestamp
+        """
+        epoch = self._archive_epoch(filepath)
+        return None if epoch is None else epoch_to_datetime(epoch)
+    
+    def _archive_epoch(self, filepath: str) -> Optional[int]:
+        """
+        Parse the archive timestamp encoded in an archive filename.
+        
+        Args:
+            filepath: Archive file path
+            
+        Returns:
+            Microseconds since the Unix epoch or None if the name is not a timestamp
+        """
+        # Filenames are YYYYMMDD_HHMMSS_ffffff
+        stem = Path(filepath).name.split('.')[0]
+        if len(stem) != 22 or stem[8] != '_' or stem[15] != '_':
+            return None
+        digits = stem[0:8] + stem[9:15] + stem[16:22]
+        if not digits.isdigit():
+            return None
+        try:
+            archived_at = datetime(int(stem[0:4]), int(stem[4:6]), int(stem[6:8]),
+                                   int(stem[9:11]), int(stem[11:13]), int(stem[13:15]),
+                                   int(stem[16:22]))
+        except ValueError:
+            return None
+        return datetime_to_epoch(archived_at)
+
+
+class ArchiveStream:
+    """
+    A single streaming archive cycle.
+    
+    Feeds are checksummed and written to disk individually as they are
+    received, so peak memory is bounded by the largest single feed rather
+    than the whole collection cycle. The manifest is an ordinary archive
+    package whose data indexes the feed files. It is rewritten after every
+    feed, so feeds stay listed if the process dies mid-cycle, and is marked
+    complete on close. In write-ahead log mode the cycle's writes share
+    group commits: they are made durable together when the stream closes.
+    """
+    
+    def __init__(self, archiver: DataArchiver, source: str, metadata: Optional[Dict] = None):
+        """
+        Initialize the stream.
+        
+        Args:
+            archiver: Archiver the stream writes into
+            source: Source identifier (e.g., 'solar_wind', 'cosmic')
+            metadata: Additional metadata to include in the manifest
+        """
+        self.archiver = archiver
+        self.source = source
+        self.metadata = metadata or {}
+        self.started_at = datetime.utcnow()
+        self.cycle_id = self.started_at.strftime('%Y%m%d_%H%M%S_%f')
+        
+        self.date_path = archiver.archive_path / source / self.started_at.strftime("%Y/%m/%d")
+        self.cycle_path = self.date_path / self.cycle_id
+        self.cycle_path.mkdir(parents=True, exist_ok=True)
+        
+        self.manifest_path = str(self.date_path / f"{self.cycle_id}.json")
+        self.index = {}
+        self.closed = False
+        self._lsn = None
+    
+    def write(self, feed_name: str, entry: Dict) -> str:
+        """
+        Persist a single feed entry.
+        
+        Args:
+            feed_name: Feed identifier (e.g., 'noaa_mag')
+            entry: Feed entry as produced by a collector
+            
+        Returns:
+            Feed archive file path
+        """
+        if self.closed:
+            raise ValueError("Archive stream is closed")
+        
+        filepath = self.cycle_path / f"{feed_name}.json"
+        checksum = self.archiver._calculate_checksum(entry)
+        feed_package = {
+            'version': '1.0',
+            'archived_at': datetime.utcnow().isoformat(),
+            'source': self.source,
+            'feed': feed_name,
+            'cycle': self.cycle_id,
+            'data': entry,
+            'checksum': checksum
+        }
+        
+        try:
+            self._lsn = self.archiver._write_package(filepath, feed_package, durable=False)
+        except Exception as e:
+            logger.error(f"Error archiving feed {feed_name}: {e}")
+            self.index[feed_name] = {
+                'status': 'error',
+                'error': str(e),
+                'collected_at': entry.get('collected_at')
+            }
+            raise
+        
+        self.index[feed_name] = {
+            'status': entry.get('status'),
+            'collected_at': entry.get('collected_at'),
+            'file': f"{self.cycle_id}/{filepath.name}",
+            'checksum': checksum
+        }
+        logger.info(f"Feed {feed_name} archived to {filepath}")
+        self._write_manifest(complete=False)
+        return str(filepath)
+    
+    def close(self) -> str:
+        """
+        Mark the cycle manifest complete and wait until the cycle's writes
+        are durable.
+        
+        Returns:
+            Manifest file path
+        """
+        if self.closed:
+            return self.manifest_path
+        
+        self._write_manifest(complete=True)
+        self.closed = True
+        self.archiver.wait_durable(self._lsn)
+        logger.info(f"Stream manifest archived to {self.manifest_path}")
+        return self.manifest_path
+    
+    def _write_manifest(self, complete: bool):
+        """
+        Write the manifest for the feeds indexed so far.
+        
+        Args:
+            complete: Whether the cycle has finished
+        """
+        data = {
+            'timestamp': self.started_at.isoformat(),
+            'sources': self.index
+        }
+        manifest = {
+            'version': '1.0',
+            'archived_at': datetime.utcnow().isoformat(),
+            'source': self.source,
+            'mode': 'stream',
+            'cycle': self.cycle_id,
+            'complete': complete,
+            'data': data,
+            'metadata': self.metadata,
+            'checksum': self.archiver._calculate_checksum(data)
+        }
+        
+        self._lsn = self.archiver._write_package(Path(self.manifest_path), manifest,
+                                                 durable=False)
+        self.archiver._notify(self.source, self.manifest_path)
+    
+    def __enter__(self) -> 'ArchiveStream':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Always write the manifest so feeds persisted before a failure
+        # remain reachable.
+        self.close()
+        return False
@@ -0,0 +1,336 @@
+"""
+Retention Manager
+Moves aging archive data to a compressed cold tier and prunes raw data
+"""
+
+import gzip
+import os
+import shutil
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+
+from .data_archiver import DataArchiver
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Token bucket limiting the bytes per second processed by retention work.
+    """
+
+    def __init__(self, bytes_per_second: Optional[float], stop_event: Optional[threading.Event] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            bytes_per_second: Sustained I/O budget (None or 0 for unlimited)
+            stop_event: Event that interrupts throttling sleeps
+        """
+        self.bytes_per_second = bytes_per_second or 0
+        self.stop_event = stop_event or threading.Event()
+        self._allowance = float(self.bytes_per_second)
+        self._last = time.monotonic()
+
+    def consume(self, nbytes: int):
+        """
+        Account for nbytes of I/O, sleeping if the budget is exhausted.
+
+        Args:
+            nbytes: Bytes read or written
+        """
+        if not self.bytes_per_second:
+            return
+        now = time.monotonic()
+        self._allowance = min(float(self.bytes_per_second),
+                              self._allowance + (now - self._last) * self.bytes_per_second)
+        self._last = now
+        self._allowance -= nbytes
+        if self._allowance < 0:
+            self.stop_event.wait(-self._allowance / self.bytes_per_second)
+
+
+class RetentionManager:
+    """
+    Applies a retention and tiering policy to a DataArchiver.
+
+    Policy:
+        - Days younger than hot_days stay on the hot tier as plain JSON.
+        - Older days are moved file by file to the cold tier as gzip,
+          keeping the same layout, and removed from the hot tier.
+        - Days older than drop_raw_after_days are deleted from both tiers,
+          but only when a rollup exists for them: at least one file in
+          rollup_path/<source>/<YYYY-MM-DD>/ (e.g. columnar exports).
+
+    Work proceeds one day directory at a time and is throttled by
+    max_bytes_per_second, so it can run in the background next to live
+    ingestion. Interrupted moves are safe: the cold copy and its directory
+    entry are durable before the hot file is removed, and
+    DataArchiver.list_archives ignores a cold copy while its hot original
+    still exists. Each change touches the source's generation file so
+    query caches in other processes are invalidated.
+    """
+
+    def __init__(self, archiver: DataArchiver, hot_days: int = 30,
+                 drop_raw_after_days: Optional[int] = None,
+                 rollup_path: Optional[str] = None,
+                 max_bytes_per_second: Optional[float] = 10 << 20,
+                 compress_level: int = 6, interval: float = 3600):
+        """
+        Initialize the retention manager.
+
+        Args:
+            archiver: Archiver whose archive the policy applies to; it must
+                have a cold_path configured
+            hot_days: Days of data kept uncompressed on the hot tier
+            drop_raw_after_days: Days after which raw data with a rollup is
+                deleted (None to keep raw data forever)
+            rollup_path: Base path checked for rollups
+            max_bytes_per_second: I/O budget for retention work (None for unlimited)
+            compress_level: gzip compression level for the cold tier
+            interval: Seconds between background retention passes
+        """
+        if archiver.cold_path is None:
+            raise ValueError("Retention requires an archiver with a cold_path")
+        if hot_days < 1:
+            raise ValueError("hot_days must be at least 1 so live ingestion is never touched")
+        if drop_raw_after_days is not None and drop_raw_after_days < hot_days:
+            raise ValueError("drop_raw_after_days must not be less than hot_days")
+
+        self.archiver = archiver
+        self.hot_days = hot_days
+        self.drop_raw_after_days = drop_raw_after_days
+        self.rollup_path = Path(rollup_path) if rollup_path else None
+        self.compress_level = compress_level
+        self.interval = interval
+
+        self._stop = threading.Event()
+        self._limiter = RateLimiter(max_bytes_per_second, self._stop)
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {'files_moved': 0, 'files_dropped': 0, 'bytes_in': 0, 'bytes_out': 0}
+
+    @classmethod
+    def from_config(cls, archiver: DataArchiver, config) -> 'RetentionManager':
+        """
+        Build a retention manager from the 'storage.retention' configuration.
+
+        Args:
+            archiver: Archiver to manage
+            config: ConfigLoader instance
+
+        Returns:
+            Configured retention manager
+        """
+        return cls(
+            archiver,
+            hot_days=config.get('storage.retention.hot_days', 30),
+            drop_raw_after_days=config.get('storage.retention.drop_raw_after_days'),
+            rollup_path=config.get('storage.retention.rollup_path'),
+            max_bytes_per_second=config.get('storage.retention.max_bytes_per_second', 10 << 20),
+            compress_level=config.get('storage.retention.compress_level', 6),
+            interval=config.get('storage.retention.interval', 3600)
+        )
+
+    def start(self):
+        """Run retention passes in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="luft-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop the background thread after the file in progress.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Error during retention pass: {e}")
+            self._stop.wait(self.interval)
+
+    def run_once(self, today: Optional[date] = None) -> Dict[str, int]:
+        """
+        Apply the policy to every eligible day directory.
+
+        Args:
+            today: Reference date (defaults to the current UTC date)
+
+        Returns:
+            Counts of days moved to the cold tier and dropped
+        """
+        today = today or datetime.utcnow().date()
+        moved = dropped = 0
+
+        for action, source, day in self.plan(today):
+            if self._stop.is_set():
+                break
+            if action == 'drop':
+                self._drop_day(source, day)
+                dropped += 1
+            else:
+                self._move_day(source, day)
+                moved += 1
+
+        if moved or dropped:
+            logger.info(f"Retention pass complete: {moved} days moved to cold tier, "
+                        f"{dropped} days dropped")
+        return {'moved': moved, 'dropped': dropped}
+
+    def plan(self, today: date) -> List[Tuple[str, str, date]]:
+        """
+        List the retention actions due, oldest first.
+
+        Args:
+            today: Reference date
+
+        Returns:
+            List of (action, source, day) where action is 'move' or 'drop'
+        """
+        hot_cutoff = today - timedelta(days=self.hot_days)
+        drop_cutoff = None
+        if self.drop_raw_after_days is not None:
+            drop_cutoff = today - timedelta(days=self.drop_raw_after_days)
+
+        actions = {}
+        for tier_path in (self.archiver.archive_path, self.archiver.cold_path):
+            for source, day, _ in self._iter_days(tier_path):
+                if drop_cutoff is not None and day < drop_cutoff and self.has_rollup(source, day):
+                    actions[(source, day)] = 'drop'
+                elif tier_path == self.archiver.archive_path and day < hot_cutoff:
+                    actions.setdefault((source, day), 'move')
+
+        return [(action, source, day) for (source, day), action in
+                sorted(actions.items(), key=lambda item: (item[0][1], item[0][0]))]
+
+    def has_rollup(self, source: str, day: date) -> bool:
+        """
+        Check whether a rollup exists for a source and day.
+
+        Args:
+            source: Source identifier
+            day: Day to check
+
+        Returns:
+            True if the rollup directory for the day contains any file
+        """
+        if self.rollup_path is None:
+            return False
+        rollup_dir = self.rollup_path / source / day.isoformat()
+        return rollup_dir.is_dir() and any(f.is_file() for f in rollup_dir.iterdir())
+
+    def _iter_days(self, tier_path: Path) -> Iterator[Tuple[str, date, Path]]:
+        """Yield (source, day, directory) for every YYYY/MM/DD directory in a tier."""
+        if tier_path is None or not tier_path.exists():
+            return
+        for source_dir in sorted(tier_path.iterdir()):
+            # Skip internal directories such as the write-ahead log
+            if not source_dir.is_dir() or source_dir.name.startswith('.'):
+                continue
+            for day_dir in sorted(source_dir.glob("*/*/*")):
+                if not day_dir.is_dir():
+                    continue
+                try:
+                    day = datetime.strptime(
+                        day_dir.relative_to(source_dir).as_posix(), "%Y/%m/%d").date()
+                except ValueError:
+                    continue
+                yield source_dir.name, day, day_dir
+
+    def _day_dir(self, tier_path: Path, source: str, day: date) -> Path:
+        return tier_path / source / day.strftime("%Y/%m/%d")
+
+    def _move_day(self, source: str, day: date):
+        """Compress one hot day directory into the cold tier."""
+        hot_dir = self._day_dir(self.archiver.archive_path, source, day)
+        cold_dir = self._day_dir(self.archiver.cold_path, source, day)
+
+        moved = 0
+        try:
+            for hot_file in sorted(f for f in hot_dir.rglob("*") if f.is_file()):
+                if self._stop.is_set():
+                    return
+                if hot_file.name.endswith(".tmp"):
+                    continue
+                relative = hot_file.relative_to(hot_dir)
+                cold_file = cold_dir / (relative.as_posix() + self.archiver.COLD_SUFFIX)
+                self._compress(hot_file, cold_file)
+                # The cold copy's directory entry must be durable before the
+                # only other copy is removed
+                DataArchiver._fsync_path(cold_file.parent)
+                hot_file.unlink()
+                moved += 1
+                self.stats['files_moved'] += 1
+        finally:
+            if moved:
+                self.archiver.touch_generation(source)
+
+        self._remove_empty_dirs(hot_dir, self.archiver.archive_path / source)
+        logger.info(f"Moved {source} {day.isoformat()} to cold tier")
+
+    def _compress(self, source_file: Path, target_file: Path):
+        """Write a durable gzip copy of a file, throttled by the rate limiter."""
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = target_file.with_name(target_file.name + ".tmp")
+        chunk_size = 256 * 1024
+
+        with open(source_file, 'rb') as src, open(tmp_file, 'wb') as raw:
+            with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=self.compress_level,
+                               filename=source_file.name) as dst:
+                while True:
+                    chunk = src.read(chunk_size)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    self._limiter.consume(len(chunk))
+                    self.stats['bytes_in'] += len(chunk)
+            raw.flush()
+            os.fsync(raw.fileno())
+            self.stats['bytes_out'] += raw.tell()
+
+        os.replace(tmp_file, target_file)
+
+    def _drop_day(self, source: str, day: date):
+        """Delete the raw data for one day from both tiers."""
+        for tier_path in (self.archiver.archive_path, self.archiver.cold_path):
+            day_dir = self._day_dir(tier_path, source, day)
+            if not day_dir.exists():
+                continue
+            files = [f for f in day_dir.rglob("*") if f.is_file()]
+            for f in files:
+                self._limiter.consume(4096)
+            shutil.rmtree(day_dir)
+            self.stats['files_dropped'] += len(files)
+            self._remove_empty_dirs(day_dir.parent, tier_path / source)
+        self.archiver.touch_generation(source)
+        logger.info(f"Dropped raw {source} data for {day.isoformat()} (rollup exists)")
+
+    @staticmethod
+    def _remove_empty_dirs(start: Path, stop: Path):
+        """Remove empty directories from start up to (not including) stop."""
+        for directory in sorted((d for d in start.rglob("*") if d.is_dir()), reverse=True):
+            try:
+                directory.rmdir()
+            except OSError:
+                pass
+        current = start
+        while current != stop and stop in current.parents:
+            try:
+                current.rmdir()
+            except OSError:
+                break
+            current = current.parent
@@ -0,0 +1,234 @@
+"""
+Write-Ahead Log
+Append-only log with group commit for crash-safe archive writes
+"""
+
+import os
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Record header: payload length, CRC-32 of payload, path length
+RECORD_HEADER = struct.Struct('<IIH')
+
+
+class WriteAheadLog:
+    """
+    Append-only log whose records are made durable in groups.
+
+    Writers append a record and later wait for it to become durable, either
+    at once (write) or after appending several records (append, then
+    wait_durable for the last one). A background committer flushes and
+    fsyncs everything appended so far in one call. When exactly one writer
+    is waiting it commits immediately; otherwise it holds the group open
+    for up to commit_interval or until commit_bytes are pending, so
+    deferred appends and concurrent writers share a single fsync.
+
+    Each record holds a destination path relative to the archive root and
+    the file body to write there. Records end with a CRC so a torn tail left
+    by a crash is detected and ignored on replay.
+    """
+
+    def __init__(self, log_path: str, commit_interval: float = 0.05,
+                 commit_bytes: int = 1 << 20):
+        """
+        Initialize the write-ahead log.
+
+        Args:
+            log_path: Path of the log file
+            commit_interval: Maximum seconds a group stays open for more
+                records when no lone writer is waiting on it
+            commit_bytes: Pending bytes that trigger an immediate group commit
+        """
+        self.log_path = Path(log_path)
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.commit_interval = commit_interval
+        self.commit_bytes = commit_bytes
+
+        self._file = open(self.log_path, 'ab')
+        self._lock = threading.Lock()
+        self._appended = threading.Condition(self._lock)
+        self._committed = threading.Condition(self._lock)
+
+        # Sequence numbers count bytes appended since open, so they keep
+        # increasing across truncation
+        self._appended_lsn = 0
+        self._durable_lsn = 0
+        self._waiters = 0
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+        self._committer = threading.Thread(target=self._commit_loop, name="luft-wal-commit",
+                                           daemon=True)
+        self._committer.start()
+
+    @property
+    def size(self) -> int:
+        """Current size of the log file in bytes."""
+        return self._file.tell()
+
+    def append(self, relative_path: str, body: bytes) -> int:
+        """
+        Append a record without waiting for it to become durable.
+
+        Args:
+            relative_path: Destination path relative to the archive root
+            body: File contents
+
+        Returns:
+            Sequence number to pass to wait_durable()
+        """
+        path_bytes = relative_path.encode()
+        payload = path_bytes + body
+        record = RECORD_HEADER.pack(len(payload), zlib.crc32(payload), len(path_bytes)) + payload
+
+        with self._lock:
+            if self._closed:
+                raise ValueError("Write-ahead log is closed")
+            self._file.write(record)
+            self._appended_lsn += len(record)
+            lsn = self._appended_lsn
+            pending = lsn - self._durable_lsn
+            if pending == len(record) or pending >= self.commit_bytes:
+                self._appended.notify()
+        return lsn
+
+    def wait_durable(self, lsn: int):
+        """
+        Block until the record with the given sequence number is on disk.
+
+        Args:
+            lsn: Sequence number returned by append()
+        """
+        with self._lock:
+            self._waiters += 1
+            # Let the committer re-check whether it can commit now
+            self._appended.notify()
+            try:
+                while self._durable_lsn < lsn:
+                    if self._error is not None:
+                        raise IOError(f"Write-ahead log commit failed: {self._error}")
+                    if self._closed:
+                        raise ValueError("Write-ahead log closed before commit")
+                    self._committed.wait()
+            finally:
+                self._waiters -= 1
+
+    def write(self, relative_path: str, body: bytes):
+        """
+        Append a record and wait for its group commit.
+
+        Args:
+            relative_path: Destination path relative to the archive root
+            body: File contents
+        """
+        self.wait_durable(self.append(relative_path, body))
+
+    def _commit_loop(self):
+        """Background group committer."""
+        while True:
+            with self._lock:
+                while self._appended_lsn == self._durable_lsn and not self._closed:
+                    self._appended.wait()
+                if self._closed and self._appended_lsn == self._durable_lsn:
+                    return
+
+                # Commit at once for a lone waiting writer. Otherwise hold
+                # the group open so deferred appends and concurrent writers
+                # share the fsync.
+                deadline = time.monotonic() + self.commit_interval
+                while (self._waiters != 1 and not self._closed
+                       and self._appended_lsn - self._durable_lsn < self.commit_bytes):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._appended.wait(remaining)
+
+                try:
+                    self._file.flush()
+                except Exception as e:
+                    self._fail(e)
+                    return
+                target = self._appended_lsn
+                fd = self._file.fileno()
+
+            # fsync outside the lock so appends can continue meanwhile
+            try:
+                os.fsync(fd)
+            except Exception as e:
+                with self._lock:
+                    self._fail(e)
+                return
+
+            with self._lock:
+                self._durable_lsn = max(self._durable_lsn, target)
+                self._committed.notify_all()
+
+    def _fail(self, error: BaseException):
+        """Record a commit failure and wake all waiters (lock held)."""
+        logger.error(f"Write-ahead log commit failed: {error}")
+        self._error = error
+        self._committed.notify_all()
+
+    def replay(self, apply: Callable[[str, bytes], None]) -> int:
+        """
+        Re-apply every intact record in the log.
+
+        Stops at the first torn or corrupt record, which can only be the
+        tail of an interrupted append.
+
+        Args:
+            apply: Called with (relative path, body) for each record
+
+        Returns:
+            Number of records applied
+        """
+        with self._lock:
+            self._file.flush()
+
+        count = 0
+        with open(self.log_path, 'rb') as f:
+            while True:
+                header = f.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    break
+                length, crc, path_length = RECORD_HEADER.unpack(header)
+                payload = f.read(length)
+                if len(payload) < length or zlib.crc32(payload) != crc or path_length > length:
+                    logger.warning(f"Discarding torn write-ahead log tail at offset "
+                                   f"{f.tell() - len(payload) - RECORD_HEADER.size}")
+                    break
+                apply(payload[:path_length].decode(), payload[path_length:])
+                count += 1
+        return count
+
+    def truncate(self):
+        """
+        Discard all records. Callers must first make every applied record
+        durable in its final location.
+        """
+        with self._lock:
+            self._file.flush()
+            self._file.truncate(0)
+            self._file.seek(0)
+            os.fsync(self._file.fileno())
+            self._durable_lsn = self._appended_lsn
+            self._committed.notify_all()
+
+    def close(self):
+        """Commit outstanding records and stop the committer."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._appended.notify_all()
+        self._committer.join()
+        with self._lock:
+            self._committed.notify_all()
+        self._file.close()
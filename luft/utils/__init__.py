@@ -4,5 +4,6 @@ Utilities initialization
 
 from .logger import setup_logging
 from .config_loader import ConfigLoader
+from .time_codec import parse_time_tags, format_time_tags
 
-__all__ = ['setup_logging', 'ConfigLoader']
+__all__ = ['setup_logging', 'ConfigLoader', 'parse_time_tags', 'format_time_tags']
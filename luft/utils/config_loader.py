@@ -65,7 +65,30 @@ class ConfigLoader:
             },
             'storage': {
                 'archive_path': 'data/archive',
-                'cache_path': 'data/cache'
+                'cache_path': 'data/cache',
+                'cold_path': 'data/cold',
+                'streaming': False,
+                'retention': {
+                    'enabled': False,
+                    'hot_days': 30,
+                    'drop_raw_after_days': None,
+                    'rollup_path': 'data/rollups',
+                    'max_bytes_per_second': 10485760,
+                    'interval': 3600
+                },
+                'wal': {
+                    'enabled': False,
+                    'commit_interval': 0.05,
+                    'commit_bytes': 1048576,
+                    'checkpoint_bytes': 67108864
+                }
+            },
+            'server': {
+                'host': '127.0.0.1',
+                'port': 8765,
+                'cache_size': 256,
+                'cache_ttl': 30,
+                'workers': 8
             },
             'logging': {
                 'level': 'INFO',
@@ -0,0 +1,225 @@
+"""
+Timestamp codec for LUFT
+Bulk conversion between NOAA time tags and epoch microseconds
+"""
+
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the fixed-format parser is used instead
+    np = None
+
+# Sentinel for missing timestamps (same bit pattern as NumPy's NaT)
+NULL_TIMESTAMP = -2 ** 63
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_US_PER_DAY = 86400 * 1000000
+_FRACTION_PAD = '000000'
+
+
+def parse_time_tag(value: Optional[str]) -> int:
+    """
+    Convert a single ISO-8601 time tag to epoch microseconds (UTC).
+
+    Args:
+        value: Time tag (e.g., '2025-11-23T12:00:00' or '2025-11-23 12:00:00.000')
+
+    Returns:
+        Microseconds since the Unix epoch, or NULL_TIMESTAMP for None
+    """
+    return _parse_fixed(value, {})
+
+
+def parse_time_tags(values: Iterable[Optional[str]], use_numpy: Optional[bool] = None):
+    """
+    Convert a column of ISO-8601 time tags to epoch microseconds (UTC).
+
+    Accepts the formats NOAA feeds use: 'YYYY-MM-DD', 'YYYY-MM-DD HH:MM',
+    'YYYY-MM-DDTHH:MM:SS' with optional fractional seconds and an optional
+    trailing 'Z'. Anything else is handed to datetime.fromisoformat.
+
+    Args:
+        values: Time tags; None entries become NULL_TIMESTAMP
+        use_numpy: Force (True) or disable (False) the NumPy datetime64 path;
+            by default it is used when NumPy is installed
+
+    Returns:
+        int64 NumPy array if NumPy is used, otherwise array('q')
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+
+    if use_numpy:
+        if np is None:
+            raise ImportError("NumPy is required for the datetime64 path")
+        try:
+            return _parse_numpy(values)
+        except ValueError:
+            # Offsets other than 'Z' are not understood by datetime64
+            pass
+
+    day_cache: Dict[str, int] = {}
+    parsed = array('q', [_parse_fixed(value, day_cache) for value in values])
+    if use_numpy:
+        return np.frombuffer(parsed, dtype=np.int64).copy()
+    return parsed
+
+
+def format_time_tags(epochs: Sequence[int], sep: str = 'T') -> List[Optional[str]]:
+    """
+    Convert a column of epoch microseconds back to ISO-8601 time tags.
+
+    Fractional seconds are included for every value when any value in the
+    column has them, so a column round-trips with a uniform width.
+
+    Args:
+        epochs: Microseconds since the Unix epoch; NULL_TIMESTAMP becomes None
+        sep: Separator between date and time
+
+    Returns:
+        List of time tags
+    """
+    if np is not None and isinstance(epochs, np.ndarray):
+        values = epochs.astype(np.int64, copy=False)
+        valid = values != NULL_TIMESTAMP
+        unit = 'us' if np.any(values[valid] % 1000000) else 's'
+        text = np.datetime_as_string(values.view('datetime64[us]'), unit=unit)
+        return [
+            (tag if sep == 'T' else tag.replace('T', sep, 1)) if ok else None
+            for tag, ok in zip(text.tolist(), valid.tolist())
+        ]
+
+    with_fraction = any(epoch % 1000000 for epoch in epochs if epoch != NULL_TIMESTAMP)
+    day_cache: Dict[int, str] = {}
+    results = []
+    for epoch in epochs:
+        if epoch == NULL_TIMESTAMP:
+            results.append(None)
+            continue
+        days, micros = divmod(epoch, _US_PER_DAY)
+        day_text = day_cache.get(days)
+        if day_text is None:
+            day_text = date.fromordinal(days + _EPOCH_ORDINAL).isoformat()
+            day_cache[days] = day_text
+        seconds, micros = divmod(micros, 1000000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        if with_fraction:
+            results.append(f"{day_text}{sep}{hours:02d}:{minutes:02d}:{seconds:02d}.{micros:06d}")
+        else:
+            results.append(f"{day_text}{sep}{hours:02d}:{minutes:02d}:{seconds:02d}")
+    return results
+
+
+def format_time_tag(epoch: int, sep: str = 'T') -> Optional[str]:
+    """
+    Convert a single epoch microsecond value to an ISO-8601 time tag.
+
+    Args:
+        epoch: Microseconds since the Unix epoch
+        sep: Separator between date and time
+
+    Returns:
+        Time tag, or None for NULL_TIMESTAMP
+    """
+    return format_time_tags([epoch], sep=sep)[0]
+
+
+def datetime_to_epoch(value: datetime) -> int:
+    """
+    Convert a datetime to epoch microseconds (naive values are taken as UTC).
+
+    Args:
+        value: Datetime to convert
+
+    Returns:
+        Microseconds since the Unix epoch
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    days = value.toordinal() - _EPOCH_ORDINAL
+    return (days * 86400 + value.hour * 3600 + value.minute * 60 + value.second) * 1000000 \
+        + value.microsecond
+
+
+def epoch_to_datetime(epoch: int) -> datetime:
+    """
+    Convert epoch microseconds to a naive UTC datetime.
+
+    Args:
+        epoch: Microseconds since the Unix epoch
+
+    Returns:
+        Naive datetime in UTC
+    """
+    return datetime(1970, 1, 1) + timedelta(microseconds=epoch)
+
+
+def _parse_numpy(values: Sequence[Optional[str]]):
+    """Parse time tags through NumPy's datetime64 ISO parser."""
+    cleaned = [
+        'NaT' if value is None else (value[:-1] if value.endswith('Z') else value)
+        for value in values
+    ]
+    return np.array(cleaned, dtype='datetime64[us]').astype(np.int64)
+
+
+def _parse_fixed(value: Optional[str], day_cache: Dict[str, int]) -> int:
+    """
+    Parse one time tag with fixed-position slicing.
+
+    The date part is cached, since a column repeats the same few days.
+    """
+    if value is None:
+        return NULL_TIMESTAMP
+
+    length = len(value)
+    if value.endswith('Z'):
+        length -= 1
+
+    if length < 10 or value[4] != '-' or value[7] != '-' or \
+            (length > 10 and value[10] not in 'T '):
+        return _parse_fallback(value)
+
+    try:
+        days = day_cache.get(value[:10])
+        if days is None:
+            days = date(int(value[0:4]), int(value[5:7]), int(value[8:10])).toordinal() \
+                - _EPOCH_ORDINAL
+            day_cache[value[:10]] = days
+
+        seconds = 0
+        micros = 0
+        if length == 10:
+            pass
+        elif length == 16:
+            if value[13] != ':':
+                return _parse_fallback(value)
+            seconds = int(value[11:13]) * 3600 + int(value[14:16]) * 60
+        elif length == 19 or (length > 20 and value[19] == '.'):
+            if value[13] != ':' or value[16] != ':':
+                return _parse_fallback(value)
+            seconds = int(value[11:13]) * 3600 + int(value[14:16]) * 60 + int(value[17:19])
+            if length > 20:
+                micros = int((value[20:length] + _FRACTION_PAD)[:6])
+        else:
+            return _parse_fallback(value)
+    except ValueError:
+        return _parse_fallback(value)
+
+    return (days * 86400 + seconds) * 1000000 + micros
+
+
+def _parse_fallback(value: str) -> int:
+    """Parse a time tag that does not fit the fixed layout."""
+    text = value[:-1] + '+00:00' if value.endswith('Z') else value
+    try:
+        return datetime_to_epoch(datetime.fromisoformat(text))
+    except ValueError:
+        raise ValueError(f"Invalid time tag: {value!r}")
+
@@ -13,8 +13,8 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from luft.collectors import SolarWindCollector, CosmicDataCollector
-from luft.storage import DataArchiver
+from luft.collectors import SolarWindCollector, CosmicDataCollector, FeedCollector
+from luft.storage import DataArchiver, RetentionManager
 from luft.utils import setup_logging, ConfigLoader
 
 
@@ -37,13 +37,28 @@ class LUFTRunner:
             log_file=self.config.get('logging.file', 'logs/luft.log')
         )
         
-        # Initialize collectors
-        self.solar_wind_collector = SolarWindCollector()
-        self.cosmic_collector = CosmicDataCollector()
+        # Initialize collectors. A 'collectors.feeds' list switches the
+        # runner to the config-driven feed engine.
+        self.solar_wind_collector = SolarWindCollector(self.config.get('collectors.solar_wind', {}))
+        self.cosmic_collector = CosmicDataCollector(self.config.get('collectors.cosmic_data', {}))
+        self.feed_collector = FeedCollector(self.config) if self.config.get('collectors.feeds') else None
         
         # Initialize archiver
         archive_path = self.config.get('storage.archive_path', 'data/archive')
-        self.archiver = DataArchiver(archive_path)
+        self.archiver = DataArchiver(
+            archive_path,
+            wal=self.config.get('storage.wal.enabled', False),
+            commit_interval=self.config.get('storage.wal.commit_interval', 0.05),
+            commit_bytes=self.config.get('storage.wal.commit_bytes', 1 << 20),
+            checkpoint_bytes=self.config.get('storage.wal.checkpoint_bytes', 64 << 20),
+            cold_path=self.config.get('storage.cold_path')
+        )
+        
+        # Background retention and tiering, if enabled
+        self.retention = None
+        if self.config.get('storage.retention.enabled', False):
+            self.retention = RetentionManager.from_config(self.archiver, self.config)
+        self.streaming = self.config.get('storage.streaming', False)
         
         # Control flags
         self.running = True
@@ -61,17 +76,27 @@ class LUFTRunner:
         """Collect and archive solar wind data."""
         try:
             self.logger.info("Collecting solar wind data...")
-            data = self.solar_wind_collector.collect_realtime_data()
+            metadata = {
+                'collector': 'SolarWindCollector',
+                'version': '0.1.0'
+            }
             
-            # Archive the data
-            filepath = self.archiver.archive_data(
-                data=data,
-                source='solar_wind',
-                metadata={
-                    'collector': 'SolarWindCollector',
-                    'version': '0.1.0'
-                }
-            )
+            if self.streaming:
+                # Persist each feed as soon as it is fetched
+                filepath = self.archiver.archive_stream(
+                    self.solar_wind_collector.iter_realtime_data(),
+                    source='solar_wind',
+                    metadata=metadata
+                )
+            else:
+                data = self.solar_wind_collector.collect_realtime_data()
+                
+                # Archive the data
+                filepath = self.archiver.archive_data(
+                    data=data,
+                    source='solar_wind',
+                    metadata=metadata
+                )
             
             self.logger.info(f"Solar wind data archived: {filepath}")
             return True
@@ -83,17 +108,27 @@ class LUFTRunner:
         """Collect and archive cosmic data."""
         try:
             self.logger.info("Collecting cosmic data...")
-            data = self.cosmic_collector.collect_realtime_data()
+            metadata = {
+                'collector': 'CosmicDataCollector',
+                'version': '0.1.0'
+            }
             
-            # Archive the data
-            filepath = self.archiver.archive_data(
-                data=data,
-                source='cosmic',
-                metadata={
-                    'collector': 'CosmicDataCollector',
-                    'version': '0.1.0'
-                }
-            )
+            if self.streaming:
+                # Persist each feed as soon as it is fetched
+                filepath = self.archiver.archive_stream(
+                    self.cosmic_collector.iter_realtime_data(),
+                    source='cosmic',
+                    metadata=metadata
+                )
+            else:
+                data = self.cosmic_collector.collect_realtime_data()
+                
+                # Archive the data
+                filepath = self.archiver.archive_data(
+                    data=data,
+                    source='cosmic',
+                    metadata=metadata
+                )
             
             self.logger.info(f"Cosmic data archived: {filepath}")
             return True
@@ -101,19 +136,68 @@ class LUFTRunner:
             self.logger.error(f"Error collecting cosmic data: {e}")
             return False
     
+    def collect_and_archive_feeds(self, force: bool = False) -> int:
+        """
+        Collect and archive all due configured feeds.
+        
+        Args:
+            force: Collect every enabled feed regardless of schedule
+            
+        Returns:
+            Number of feeds collected
+        """
+        metadata = {
+            'collector': 'FeedCollector',
+            'version': '0.1.0'
+        }
+        count = 0
+        
+        try:
+            if self.streaming:
+                # Persist each feed as soon as it completes, one stream per source
+                streams = {}
+                try:
+                    for feed, entry in self.feed_collector.iter_due(force=force):
+                        stream = streams.get(feed.source)
+                        if stream is None:
+                            stream = self.archiver.open_stream(feed.source, metadata)
+                            streams[feed.source] = stream
+                        stream.write(feed.name, entry)
+                        count += 1
+                finally:
+                    for source, stream in streams.items():
+                        filepath = stream.close()
+                        self.logger.info(f"{source} feeds archived: {filepath}")
+            else:
+                for source, data in self.feed_collector.collect_due(force=force).items():
+                    filepath = self.archiver.archive_data(
+                        data=data,
+                        source=source,
+                        metadata=metadata
+                    )
+                    count += len(data['sources'])
+                    self.logger.info(f"{source} feeds archived: {filepath}")
+        except Exception as e:
+            self.logger.error(f"Error collecting feeds: {e}")
+        
+        return count
+    
     def run_once(self):
         """Run a single collection cycle."""
         self.logger.info("=" * 60)
         self.logger.info("Starting data collection cycle")
         self.logger.info("=" * 60)
         
-        # Collect solar wind data if enabled
-        if self.config.get('collectors.solar_wind.enabled', True):
-            self.collect_and_archive_solar_wind()
-        
-        # Collect cosmic data if enabled
-        if self.config.get('collectors.cosmic_data.enabled', True):
-            self.collect_and_archive_cosmic_data()
+        if self.feed_collector:
+            self.collect_and_archive_feeds(force=True)
+        else:
+            # Collect solar wind data if enabled
+            if self.config.get('collectors.solar_wind.enabled', True):
+                self.collect_and_archive_solar_wind()
+            
+            # Collect cosmic data if enabled
+            if self.config.get('collectors.cosmic_data.enabled', True):
+                self.collect_and_archive_cosmic_data()
         
         self.logger.info("Collection cycle complete")
     
@@ -124,6 +208,10 @@ class LUFTRunner:
         self.logger.info("Automated Data Collection System")
         self.logger.info("=" * 60)
         
+        if self.feed_collector:
+            self.run_feed_schedule()
+            return
+        
         interval = self.config.get('collectors.solar_wind.interval', 300)
         self.logger.info(f"Collection interval: {interval} seconds")
         
@@ -142,6 +230,30 @@ class LUFTRunner:
                     time.sleep(60)
         
         self.logger.info("LUFT automation stopped")
+    
+    def run_feed_schedule(self):
+        """Run continuous collection of configured feeds on their own cadences."""
+        feeds = self.feed_collector.feeds
+        self.logger.info(f"Scheduling {len(feeds)} feeds across "
+                         f"{len(self.feed_collector.sources)} sources "
+                         f"(max {self.feed_collector.max_concurrency} concurrent fetches)")
+        
+        while self.running:
+            try:
+                if self.feed_collector.due_feeds():
+                    count = self.collect_and_archive_feeds()
+                    self.logger.info(f"Collected {count} feeds")
+                
+                if self.running:
+                    time.sleep(min(self.feed_collector.seconds_until_next(), 60))
+                    
+            except Exception as e:
+                self.logger.error(f"Error in main loop: {e}")
+                if self.running:
+                    self.logger.info("Waiting 60 seconds before retry...")
+                    time.sleep(60)
+        
+        self.logger.info("LUFT automation stopped")
 
 
 def main():
@@ -167,10 +279,19 @@ def main():
     # Initialize and run
     runner = LUFTRunner(config_file=args.config)
     
-    if args.once:
-        runner.run_once()
-    else:
-        runner.run_continuous()
+    try:
+        if args.once:
+            runner.run_once()
+        else:
+            if runner.retention:
+                runner.retention.start()
+            runner.run_continuous()
+    finally:
+        if runner.retention:
+            runner.retention.stop()
+        if runner.feed_collector:
+            runner.feed_collector.close()
+        runner.archiver.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,153 @@
+"""
+Tests for the archive query server
+"""
+
+import asyncio
+import gzip
+import http.client
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from luft.storage import ArchiveQueryServer, DataArchiver
+
+
+@pytest.fixture
+def archiver(tmp_path):
+    return DataArchiver(str(tmp_path / "archive"))
+
+
+@pytest.fixture
+def server(archiver):
+    server = ArchiveQueryServer(archiver, port=0, cache_ttl=3600, workers=2,
+                                compress_min_bytes=64)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(server.start())
+        started.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert started.wait(5)
+    yield server
+    asyncio.run_coroutine_threadsafe(server.stop(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+
+def get(server, target, headers=None):
+    conn = http.client.HTTPConnection(server.host, server.port, timeout=5)
+    try:
+        conn.request('GET', target, headers=headers or {})
+        response = conn.getresponse()
+        body = response.read()
+        if response.getheader('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return response.status, json.loads(body), response
+    finally:
+        conn.close()
+
+
+def test_health(server):
+    status, body, _ = get(server, '/health')
+    assert status == 200
+    assert body['status'] == 'ok'
+
+
+def test_latest(server, archiver):
+    archiver.archive_data({'value': 1}, 'solar_wind')
+    filepath = archiver.archive_data({'value': 2}, 'solar_wind')
+
+    status, body, _ = get(server, '/latest?source=solar_wind')
+    assert status == 200
+    assert body['path'] == filepath
+    assert body['archive']['data'] == {'value': 2}
+
+
+def test_archives_by_date(server, archiver):
+    filepath = archiver.archive_data({'value': 1}, 'solar_wind')
+    date = Path(filepath).name[:8]
+    date = f"{date[:4]}-{date[4:6]}-{date[6:]}"
+
+    status, body, _ = get(server, f'/archives?source=solar_wind&date={date}')
+    assert status == 200
+    assert body['archives'] == [filepath]
+
+    status, body, _ = get(server, f'/archives?source=solar_wind&date={date}T00:00:00')
+    assert status == 400
+
+
+def test_range(server, archiver):
+    for value in range(3):
+        archiver.archive_data({'value': value}, 'solar_wind')
+
+    status, body, _ = get(server, '/range?source=solar_wind&start=2000-01-01&end=2100-01-01&limit=2')
+    assert status == 200
+    assert body['total'] == 3
+    assert [a['archive']['data']['value'] for a in body['archives']] == [0, 1]
+
+    status, _, _ = get(server, '/range?source=solar_wind&start=2000-01-01')
+    assert status == 400
+    status, _, _ = get(server, '/range?source=solar_wind&start=yesterday&end=2100-01-01')
+    assert status == 400
+
+
+@pytest.mark.parametrize('target, expected', [
+    ('/nowhere?source=solar_wind', 404),
+    ('/latest', 400),
+    ('/latest?source=nosuch', 400),
+    ('/latest?source=../outside', 400),
+    ('/latest?source=.wal', 400),
+    ('/latest?source=solar_wind/..', 400),
+])
+def test_bad_requests(server, archiver, target, expected):
+    archiver.archive_data({'value': 1}, 'solar_wind')
+    status, body, _ = get(server, target)
+    assert status == expected
+    assert 'error' in body
+
+
+def test_gzip_response(server, archiver):
+    archiver.archive_data({'value': list(range(100))}, 'solar_wind')
+    status, body, response = get(server, '/latest?source=solar_wind',
+                                 {'Accept-Encoding': 'gzip'})
+    assert status == 200
+    assert response.getheader('Content-Encoding') == 'gzip'
+    assert body['archive']['data']['value'][-1] == 99
+
+
+def test_cache_hit(server, archiver):
+    archiver.archive_data({'value': 1}, 'solar_wind')
+    get(server, '/latest?source=solar_wind')
+    get(server, '/latest?source=solar_wind')
+    assert server.stats['cache_misses'] == 1
+    assert server.stats['cache_hits'] == 1
+
+
+def test_write_invalidates_cache(server, archiver):
+    archiver.archive_data({'value': 1}, 'solar_wind')
+    get(server, '/latest?source=solar_wind')
+
+    filepath = archiver.archive_data({'value': 2}, 'solar_wind')
+    status, body, _ = get(server, '/latest?source=solar_wind')
+    assert body['path'] == filepath
+    assert server.stats['cache_hits'] == 0
+
+
+def test_write_from_other_archiver_invalidates_cache(server, archiver):
+    archiver.archive_data({'value': 1}, 'solar_wind')
+    get(server, '/latest?source=solar_wind')
+
+    # A separate archiver (as in another process) has no in-process listener
+    other = DataArchiver(str(archiver.archive_path))
+    filepath = other.archive_data({'value': 2}, 'solar_wind')
+    status, body, _ = get(server, '/latest?source=solar_wind')
+    assert body['path'] == filepath
+    assert server.stats['cache_hits'] == 0
@@ -0,0 +1,95 @@
+"""
+Tests for streaming archive cycles
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from luft.storage import DataArchiver
+
+
+def entry(value):
+    return {'status': 'success', 'data': [{'bt': value}], 'collected_at': '2025-11-23T12:00:00'}
+
+
+@pytest.fixture
+def archiver(tmp_path):
+    return DataArchiver(str(tmp_path / "archive"))
+
+
+def test_stream_round_trip(archiver):
+    manifest_path = archiver.archive_stream(
+        iter([('noaa_mag', entry(1.0)), ('noaa_plasma', entry(2.0))]),
+        'solar_wind', metadata={'note': 'test'}
+    )
+
+    assert archiver.list_archives('solar_wind') == [manifest_path]
+    manifest = archiver.retrieve_data(manifest_path)
+    assert manifest['mode'] == 'stream'
+    assert manifest['complete'] is True
+    assert manifest['metadata'] == {'note': 'test'}
+    assert archiver.verify_integrity(manifest)
+
+    feeds = dict(archiver.iter_stream(manifest_path))
+    assert list(feeds) == ['noaa_mag', 'noaa_plasma']
+    assert feeds['noaa_plasma']['data'] == entry(2.0)
+    assert feeds['noaa_plasma']['cycle'] == manifest['cycle']
+
+
+def test_feeds_are_indexed_before_close(archiver):
+    stream = archiver.open_stream('solar_wind')
+    stream.write('noaa_mag', entry(1.0))
+
+    # A crash now must not leave the feed unreachable
+    assert archiver.list_archives('solar_wind') == [stream.manifest_path]
+    manifest = archiver.retrieve_data(stream.manifest_path)
+    assert manifest['complete'] is False
+    assert list(manifest['data']['sources']) == ['noaa_mag']
+    assert dict(archiver.iter_stream(stream.manifest_path))['noaa_mag']['data'] == entry(1.0)
+
+    stream.write('noaa_plasma', entry(2.0))
+    stream.close()
+    manifest = archiver.retrieve_data(stream.manifest_path)
+    assert manifest['complete'] is True
+    assert list(manifest['data']['sources']) == ['noaa_mag', 'noaa_plasma']
+
+
+def test_manifest_written_when_cycle_fails(archiver):
+    def feeds():
+        yield 'noaa_mag', entry(1.0)
+        raise RuntimeError("collector failed")
+
+    with pytest.raises(RuntimeError):
+        archiver.archive_stream(feeds(), 'solar_wind')
+
+    manifest_path, = archiver.list_archives('solar_wind')
+    manifest = archiver.retrieve_data(manifest_path)
+    assert manifest['complete'] is True
+    assert list(manifest['data']['sources']) == ['noaa_mag']
+
+
+def test_stream_leaves_no_temporary_files(archiver):
+    archiver.archive_stream(iter([('noaa_mag', entry(1.0))]), 'solar_wind')
+    leftovers = [p for p in Path(archiver.archive_path).rglob("*.tmp")]
+    assert leftovers == []
+
+
+def test_stream_notifies_listeners(archiver):
+    events = []
+    archiver.add_listener(lambda source, path: events.append((source, path)))
+    manifest_path = archiver.archive_stream(iter([('noaa_mag', entry(1.0))]), 'solar_wind')
+    assert events and all(event == ('solar_wind', manifest_path) for event in events)
+
+
+def test_stream_with_write_ahead_log(tmp_path):
+    archiver = DataArchiver(str(tmp_path / "archive"), wal=True)
+    try:
+        manifest_path = archiver.archive_stream(
+            iter([('noaa_mag', entry(1.0))]), 'solar_wind')
+        with open(manifest_path) as f:
+            assert json.load(f)['complete'] is True
+        assert dict(archiver.iter_stream(manifest_path))['noaa_mag']['data'] == entry(1.0)
+    finally:
+        archiver.close()
@@ -0,0 +1,177 @@
+"""
+Tests for the columnar export format and reader
+"""
+
+import math
+import pickle
+from datetime import datetime
+
+import pytest
+
+from luft.storage import DataArchiver, ColumnarReader, export_columnar
+from luft.utils.time_codec import format_time_tags
+
+START = datetime(2000, 1, 1)
+END = datetime(2100, 1, 1)
+
+
+def archive_feed(archiver, rows, feed='mag', source='solar_wind'):
+    return archiver.archive_data(
+        {'sources': {feed: {'status': 'success', 'data': rows}}},
+        source
+    )
+
+
+@pytest.fixture
+def archiver(tmp_path):
+    return DataArchiver(str(tmp_path / "archive"))
+
+
+def test_round_trip_with_nulls_text_and_promotion(archiver, tmp_path):
+    archive_feed(archiver, [
+        {'time_tag': '2025-11-23T12:00:00', 'bt': 1, 'count': 1, 'flag': True, 'label': 'a', 'mixed': 5},
+        {'time_tag': '2025-11-23T12:01:00', 'bt': None, 'count': 2, 'flag': False, 'label': None, 'mixed': 6},
+    ])
+    # NOAA product tables arrive as a header row followed by value rows
+    archive_feed(archiver, [
+        ['time_tag', 'bt', 'count', 'label', 'mixed', 'extra'],
+        ['2025-11-23 12:02:00.000', 2.5, 3, 'é', 'seven', 'x'],
+    ])
+
+    output = tmp_path / "export.luftcol"
+    header = export_columnar(archiver, str(output), 'solar_wind', 'mag', START, END)
+    assert header['rows'] == 3
+    assert not (tmp_path / "export.luftcol.tmp").exists()
+
+    with ColumnarReader(str(output)) as reader:
+        assert reader.num_rows == 3
+        assert reader.schema() == {
+            '_archived_at': 'timestamp[us]',
+            'time_tag': 'timestamp[us]',
+            'bt': 'float64',
+            'count': 'int64',
+            'flag': 'bool',
+            'label': 'utf8',
+            'mixed': 'utf8',
+            'extra': 'utf8',
+        }
+
+        assert format_time_tags(reader['time_tag']) == [
+            '2025-11-23T12:00:00', '2025-11-23T12:01:00', '2025-11-23T12:02:00'
+        ]
+
+        bt = list(reader['bt'])
+        assert bt[0] == 1.0 and math.isnan(bt[1]) and bt[2] == 2.5
+        assert list(reader.validity('bt')) == [1, 0, 1]
+
+        assert list(reader['count']) == [1, 2, 3]
+        assert reader.validity('count') is None
+
+        # Missing from the header-row table, so null there
+        assert list(reader['flag']) == [1, 0, 0]
+        assert list(reader.validity('flag')) == [1, 1, 0]
+
+        assert list(reader['label']) == ['a', '', 'é']
+        assert list(reader.validity('label')) == [1, 0, 1]
+
+        # Integers promoted to text once a string appears
+        assert list(reader['mixed']) == ['5', '6', 'seven']
+
+        # Column first seen in the last archive
+        assert list(reader['extra']) == ['', '', 'x']
+        assert list(reader.validity('extra')) == [0, 0, 1]
+
+
+def test_stream_manifests_are_exported(archiver, tmp_path):
+    archiver.archive_stream(
+        iter([('mag', {'status': 'success', 'data': [{'time_tag': '2025-11-23T12:00:00', 'bt': 4.0}]})]),
+        'solar_wind'
+    )
+    output = tmp_path / "stream.luftcol"
+    export_columnar(archiver, str(output), 'solar_wind', 'mag', START, END)
+
+    with ColumnarReader(str(output)) as reader:
+        assert list(reader['bt']) == [4.0]
+
+
+def test_reader_pickles_by_path(archiver, tmp_path):
+    archive_feed(archiver, [{'time_tag': '2025-11-23T12:00:00', 'bt': 1.5}])
+    output = tmp_path / "export.luftcol"
+    export_columnar(archiver, str(output), 'solar_wind', 'mag', START, END)
+
+    with ColumnarReader(str(output)) as reader:
+        clone = pickle.loads(pickle.dumps(reader))
+        try:
+            assert clone.path == reader.path
+            assert list(clone['bt']) == [1.5]
+        finally:
+            clone.close()
+
+
+def test_rejects_non_columnar_file(tmp_path):
+    path = tmp_path / "bogus.luftcol"
+    path.write_bytes(b"not a columnar file")
+    with pytest.raises(ValueError):
+        ColumnarReader(str(path))
+
+
+def test_archive_written_during_export_is_ignored(archiver, tmp_path):
+    archive_feed(archiver, [{'time_tag': '2025-11-23T12:00:00', 'bt': 1.0}])
+
+    # Land a new archive after the schema pass has listed the range
+    retrieve_many = archiver.retrieve_many
+    calls = []
+
+    def retrieve_many_with_race(paths, **kwargs):
+        calls.append(list(paths))
+        if len(calls) == 1:
+            archive_feed(archiver, [{'time_tag': '2025-11-23T12:05:00', 'bt': 2.0}] * 5)
+        return retrieve_many(paths, **kwargs)
+
+    archiver.retrieve_many = retrieve_many_with_race
+
+    output = tmp_path / "race.luftcol"
+    header = export_columnar(archiver, str(output), 'solar_wind', 'mag', START, END)
+
+    assert calls[0] == calls[1]
+    assert header['rows'] == 1
+    with ColumnarReader(str(output)) as reader:
+        assert list(reader['bt']) == [1.0]
+
+
+def test_failed_export_leaves_no_output(archiver, tmp_path, monkeypatch):
+    archive_feed(archiver, [{'time_tag': '2025-11-23T12:00:00', 'bt': 1.0}])
+
+    import luft.storage.columnar_export as columnar_export
+
+    def broken(values, *args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(columnar_export, 'parse_time_tags', broken)
+
+    output = tmp_path / "failed.luftcol"
+    with pytest.raises(OSError):
+        export_columnar(archiver, str(output), 'solar_wind', 'mag', START, END)
+    assert not output.exists()
+    assert not (tmp_path / "failed.luftcol.tmp").exists()
+
+
+def test_rejects_field_named_like_archive_time_column(archiver, tmp_path):
+    archive_feed(archiver, [{'time_tag': '2025-11-23T12:00:00', '_archived_at': 'x'}])
+
+    output = tmp_path / "collision.luftcol"
+    with pytest.raises(ValueError):
+        export_columnar(archiver, str(output), 'solar_wind', 'mag', START, END)
+    assert not output.exists()
+
+
+def test_reader_rejects_duplicate_columns(archiver, tmp_path):
+    archive_feed(archiver, [{'time_tag': '2025-11-23T12:00:00', 'xarchived_at': 1.0}])
+    output = tmp_path / "export.luftcol"
+    export_columnar(archiver, str(output), 'solar_wind', 'mag', START, END)
+
+    # Rename the column in place so the header length is unchanged
+    data = output.read_bytes()
+    output.write_bytes(data.replace(b'"name": "xarchived_at"', b'"name": "_archived_at"', 1))
+    with pytest.raises(ValueError):
+        ColumnarReader(str(output))
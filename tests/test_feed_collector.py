@@ -0,0 +1,173 @@
+"""
+Tests for the config-driven feed collector
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from luft.collectors.feed_collector import DECODERS, Feed, FeedCollector, register_decoder
+
+ROUTES = {
+    '/objects.json': [{'time_tag': '2025-11-23T12:00:00', 'bt': 1.5}],
+    '/table.json': [['time_tag', 'bt'], ['2025-11-23 12:00:00.000', '1.5']],
+}
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/plain.txt':
+            body, content_type = b'quiet sun', 'text/plain'
+        elif self.path in ROUTES:
+            body, content_type = json.dumps(ROUTES[self.path]).encode(), 'application/json'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def spec(name='mag', **overrides):
+    entry = {'name': name, 'url': 'http://127.0.0.1:9/', 'source': 'solar_wind'}
+    entry.update(overrides)
+    return entry
+
+
+def collector(*feeds, **settings):
+    return FeedCollector({'collectors': dict(settings, feeds=list(feeds))})
+
+
+@pytest.mark.parametrize('overrides', [
+    {'interval': 0},
+    {'interval': -60},
+    {'interval': None},
+    {'interval': 'hourly'},
+    {'interval': float('nan')},
+    {'timeout': 0},
+    {'timeout': None},
+    {'decoder': 'xml'},
+    {'url': ''},
+    {'source': None},
+])
+def test_invalid_feed_config(overrides):
+    with pytest.raises(ValueError):
+        collector(spec(**overrides))
+
+
+def test_invalid_default_interval():
+    with pytest.raises(ValueError):
+        collector(spec(), default_interval=0)
+
+
+def test_duplicate_feed_names():
+    with pytest.raises(ValueError, match='mag'):
+        collector(spec('mag'), spec('mag'), spec('plasma'))
+
+
+def test_defaults_and_overrides():
+    feeds = collector(spec('mag'), spec('plasma', interval=60, decoder='text', timeout=5),
+                      default_interval=120, timeout=10).feeds
+    assert [(f.interval, f.decoder, f.timeout) for f in feeds] == [
+        (120.0, 'json', 10.0), (60.0, 'text', 5.0)
+    ]
+
+
+def test_reschedule_skips_missed_slots():
+    feed = Feed('mag', 'http://127.0.0.1:9/', 'solar_wind', interval=60)
+    assert feed.is_due(0.0)
+
+    feed.reschedule(1000.0)
+    assert feed.next_due == 1060.0
+    assert not feed.is_due(1059.0) and feed.is_due(1060.0)
+
+    # Collection ran late by several intervals
+    feed.reschedule(1250.0)
+    assert feed.next_due == 1300.0
+
+
+def test_due_feeds_and_next_due():
+    feeds = collector(spec('mag', interval=60), spec('plasma', interval=300),
+                      spec('off', enabled=False))
+    assert [f.name for f in feeds.due_feeds(now=0.0)] == ['mag', 'plasma']
+    assert feeds.sources == ['solar_wind']
+
+    for feed in feeds.feeds:
+        feed.reschedule(100.0)
+    assert feeds.due_feeds(now=159.0) == []
+    assert [f.name for f in feeds.due_feeds(now=160.0)] == ['mag']
+    assert feeds.seconds_until_next(now=130.0) == 30.0
+
+
+def test_no_enabled_feeds():
+    feeds = collector(spec(enabled=False))
+    assert feeds.sources == []
+    assert feeds.seconds_until_next() == float('inf')
+
+
+def test_collect_due_decodes_feeds(base_url):
+    feeds = collector(
+        spec('objects', url=f"{base_url}/objects.json"),
+        spec('table', url=f"{base_url}/table.json", decoder='noaa_table'),
+        spec('plain', url=f"{base_url}/plain.txt", decoder='text', source='notes'),
+        spec('missing', url=f"{base_url}/missing.json"),
+        max_concurrency=2
+    )
+    try:
+        collected = feeds.collect_due()
+    finally:
+        feeds.close()
+
+    assert sorted(collected) == ['notes', 'solar_wind']
+    entries = collected['solar_wind']['sources']
+    assert entries['objects']['data'] == ROUTES['/objects.json']
+    assert entries['table']['data'] == [{'time_tag': '2025-11-23 12:00:00.000', 'bt': '1.5'}]
+    assert entries['missing']['status'] == 'error'
+    assert collected['notes']['sources']['plain'] == {
+        'status': 'success', 'data': 'quiet sun',
+        'collected_at': collected['notes']['sources']['plain']['collected_at']
+    }
+
+    # Everything was rescheduled, so nothing is due until forced
+    assert list(feeds.iter_due()) == []
+
+
+def test_force_collects_enabled_feeds(base_url):
+    feeds = collector(spec('objects', url=f"{base_url}/objects.json"),
+                      spec('off', url=f"{base_url}/objects.json", enabled=False))
+    try:
+        feeds.collect_due()
+        names = [feed.name for feed, _ in feeds.iter_due(force=True)]
+    finally:
+        feeds.close()
+    assert names == ['objects']
+
+
+def test_register_decoder(base_url):
+    register_decoder('length', lambda response: len(response.content))
+    try:
+        feeds = collector(spec('plain', url=f"{base_url}/plain.txt", decoder='length'))
+        try:
+            (feed, entry), = feeds.iter_due()
+        finally:
+            feeds.close()
+        assert entry['data'] == len(b'quiet sun')
+    finally:
+        del DECODERS['length']
@@ -0,0 +1,188 @@
+"""
+Tests for the retention and tiered-storage policy
+"""
+
+import itertools
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from luft.storage import DataArchiver, RetentionManager, data_archiver
+
+OLD_DAY = date(2020, 1, 2)
+TODAY = date(2020, 3, 1)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the archiver's clock on a given day, ticking one second per call."""
+    state = {'now': datetime(2020, 1, 1)}
+    ticks = itertools.count()
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            base = state['now']
+            return cls(base.year, base.month, base.day) + timedelta(seconds=next(ticks))
+
+    monkeypatch.setattr(data_archiver, 'datetime', FrozenDatetime)
+
+    def set_day(day: date):
+        state['now'] = datetime(day.year, day.month, day.day)
+    return set_day
+
+
+@pytest.fixture
+def archiver(tmp_path):
+    return DataArchiver(str(tmp_path / "hot"), cold_path=str(tmp_path / "cold"))
+
+
+def manager(archiver, tmp_path, **kwargs):
+    kwargs.setdefault('hot_days', 30)
+    return RetentionManager(archiver, rollup_path=str(tmp_path / "rollups"),
+                            max_bytes_per_second=None, **kwargs)
+
+
+def entry(value):
+    return {'status': 'success', 'data': [{'bt': value}]}
+
+
+def test_moved_day_stays_readable(archiver, tmp_path, clock):
+    clock(OLD_DAY)
+    bundle = archiver.archive_data({'value': 1}, 'solar_wind')
+    manifest = archiver.archive_stream(iter([('noaa_mag', entry(2.0))]), 'solar_wind')
+    clock(TODAY - timedelta(days=1))
+    recent = archiver.archive_data({'value': 3}, 'solar_wind')
+
+    result = manager(archiver, tmp_path).run_once(TODAY)
+    assert result == {'moved': 1, 'dropped': 0}
+    assert not (archiver.archive_path / 'solar_wind' / '2020' / '01').exists()
+
+    cold_bundle = str(archiver.cold_path / Path(bundle).relative_to(archiver.archive_path)) + '.gz'
+    cold_manifest = str(archiver.cold_path / Path(manifest).relative_to(archiver.archive_path)) + '.gz'
+    assert sorted(archiver.list_archives('solar_wind')) == sorted([recent, cold_bundle, cold_manifest])
+    assert sorted(archiver.list_archives('solar_wind', '2020-01-02')) == \
+        sorted([cold_bundle, cold_manifest])
+
+    # Paths recorded before the move still resolve, as str or Path
+    for path in (bundle, Path(bundle), cold_bundle):
+        package = archiver.retrieve_data(path)
+        assert package['data'] == {'value': 1}
+        assert archiver.verify_integrity(package)
+
+    assert dict(archiver.iter_stream(manifest))['noaa_mag']['data'] == entry(2.0)
+    assert dict(archiver.iter_stream(cold_manifest))['noaa_mag']['data'] == entry(2.0)
+
+
+def test_latest_archive_after_move(archiver, tmp_path, clock):
+    clock(OLD_DAY)
+    archiver.archive_data({'value': 1}, 'solar_wind')
+    latest = archiver.archive_data({'value': 2}, 'solar_wind')
+
+    manager(archiver, tmp_path).run_once(TODAY)
+
+    cold_latest = archiver.latest_archive('solar_wind')
+    assert cold_latest == str(archiver.cold_path / Path(latest).relative_to(archiver.archive_path)) + '.gz'
+    assert archiver.retrieve_data(cold_latest)['data'] == {'value': 2}
+
+
+def test_move_touches_generation(archiver, tmp_path, clock):
+    clock(OLD_DAY)
+    archiver.archive_data({'value': 1}, 'solar_wind')
+    generation_file = archiver.archive_path / 'solar_wind' / archiver.GENERATION_FILE
+    generation_file.unlink()
+
+    manager(archiver, tmp_path).run_once(TODAY)
+    assert archiver.generation_stamp('solar_wind') != 0
+
+
+def test_drop_requires_rollup(archiver, tmp_path, clock):
+    clock(OLD_DAY)
+    archiver.archive_data({'value': 1}, 'solar_wind')
+    retention = manager(archiver, tmp_path, drop_raw_after_days=60)
+    today = OLD_DAY + timedelta(days=90)
+
+    # Without a rollup the day is only moved to the cold tier
+    assert retention.run_once(today) == {'moved': 1, 'dropped': 0}
+    assert retention.run_once(today) == {'moved': 0, 'dropped': 0}
+    assert len(archiver.list_archives('solar_wind')) == 1
+
+    rollup_dir = tmp_path / "rollups" / "solar_wind" / OLD_DAY.isoformat()
+    rollup_dir.mkdir(parents=True)
+    assert retention.run_once(today) == {'moved': 0, 'dropped': 0}
+
+    (rollup_dir / "export.luftcol").write_bytes(b"rollup")
+    assert retention.plan(today) == [('drop', 'solar_wind', OLD_DAY)]
+    assert retention.run_once(today) == {'moved': 0, 'dropped': 1}
+    assert archiver.list_archives('solar_wind') == []
+    assert not (archiver.cold_path / 'solar_wind' / '2020').exists()
+
+
+def test_drop_respects_age(archiver, tmp_path, clock):
+    clock(OLD_DAY)
+    archiver.archive_data({'value': 1}, 'solar_wind')
+    rollup_dir = tmp_path / "rollups" / "solar_wind" / OLD_DAY.isoformat()
+    rollup_dir.mkdir(parents=True)
+    (rollup_dir / "export.luftcol").write_bytes(b"rollup")
+
+    retention = manager(archiver, tmp_path, drop_raw_after_days=60)
+    assert retention.plan(OLD_DAY + timedelta(days=45)) == [('move', 'solar_wind', OLD_DAY)]
+
+
+def test_skips_temporary_and_internal_entries(tmp_path, clock):
+    archiver = DataArchiver(str(tmp_path / "hot"), wal=True, cold_path=str(tmp_path / "cold"))
+    try:
+        clock(OLD_DAY)
+        archiver.archive_data({'value': 1}, 'solar_wind')
+        day_dir = archiver.archive_path / 'solar_wind' / '2020' / '01' / '02'
+        (day_dir / '20200102_235959_000000.json.tmp').write_text('{"partial')
+
+        # Internal directories are never treated as sources
+        internal_day = archiver.archive_path / archiver.WAL_DIR / '2020' / '01' / '02'
+        internal_day.mkdir(parents=True)
+        (internal_day / 'segment').write_bytes(b'log')
+
+        retention = manager(archiver, tmp_path)
+        assert retention.plan(TODAY) == [('move', 'solar_wind', OLD_DAY)]
+        retention.run_once(TODAY)
+
+        cold_day = archiver.cold_path / 'solar_wind' / '2020' / '01' / '02'
+        assert [f.name for f in cold_day.iterdir()] == ['20200102_000000_000000.json.gz']
+        assert (day_dir / '20200102_235959_000000.json.tmp').exists()
+        assert (internal_day / 'segment').exists()
+        assert not (archiver.cold_path / archiver.WAL_DIR).exists()
+    finally:
+        archiver.close()
+
+
+def test_interrupted_move_is_listed_once(archiver, tmp_path, clock):
+    clock(OLD_DAY)
+    filepath = Path(archiver.archive_data({'value': 1}, 'solar_wind'))
+    retention = manager(archiver, tmp_path)
+
+    # Crash after the cold copy was written but before the hot file was removed
+    cold_file = archiver.cold_path / (filepath.relative_to(archiver.archive_path).as_posix() + '.gz')
+    retention._compress(filepath, cold_file)
+    assert archiver.list_archives('solar_wind') == [str(filepath)]
+    assert archiver.latest_archive('solar_wind') == str(filepath)
+
+    # The next pass finishes the move
+    assert retention.run_once(TODAY) == {'moved': 1, 'dropped': 0}
+    assert archiver.list_archives('solar_wind') == [str(cold_file)]
+    assert archiver.retrieve_data(filepath)['data'] == {'value': 1}
+
+
+def test_retrieve_accepts_paths(archiver):
+    filepath = archiver.archive_data({'value': 1}, 'solar_wind')
+    assert archiver.retrieve_data(Path(filepath))['data'] == {'value': 1}
+    assert archiver.retrieve_data(Path(filepath).with_name('missing.json')) is None
+
+
+def test_rejects_unsafe_policy(archiver, tmp_path):
+    with pytest.raises(ValueError):
+        manager(archiver, tmp_path, hot_days=0)
+    with pytest.raises(ValueError):
+        manager(archiver, tmp_path, drop_raw_after_days=10)
+    with pytest.raises(ValueError):
+        RetentionManager(DataArchiver(str(tmp_path / "no_cold")))
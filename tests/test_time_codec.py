@@ -0,0 +1,113 @@
+"""
+Tests for the time tag codec
+"""
+
+from array import array
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from luft.utils import time_codec
+from luft.utils.time_codec import (
+    NULL_TIMESTAMP, datetime_to_epoch, epoch_to_datetime, format_time_tag,
+    format_time_tags, parse_time_tag, parse_time_tags
+)
+
+
+def epoch(*args) -> int:
+    return datetime_to_epoch(datetime(*args))
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2025-11-23', epoch(2025, 11, 23)),
+    ('2025-11-23T12:30', epoch(2025, 11, 23, 12, 30)),
+    ('2025-11-23 12:30', epoch(2025, 11, 23, 12, 30)),
+    ('2025-11-23T12:30:15', epoch(2025, 11, 23, 12, 30, 15)),
+    ('2025-11-23 12:30:15', epoch(2025, 11, 23, 12, 30, 15)),
+    ('2025-11-23 12:30:15.000', epoch(2025, 11, 23, 12, 30, 15)),
+    ('2025-11-23T12:30:15.1', epoch(2025, 11, 23, 12, 30, 15, 100000)),
+    ('2025-11-23T12:30:15.123', epoch(2025, 11, 23, 12, 30, 15, 123000)),
+    ('2025-11-23T12:30:15.123456', epoch(2025, 11, 23, 12, 30, 15, 123456)),
+    ('2025-11-23T12:30:15.1234567', epoch(2025, 11, 23, 12, 30, 15, 123456)),
+    ('2025-11-23Z', epoch(2025, 11, 23)),
+    ('2025-11-23T12:30:15Z', epoch(2025, 11, 23, 12, 30, 15)),
+    ('2025-11-23T12:30:15.5Z', epoch(2025, 11, 23, 12, 30, 15, 500000)),
+    ('1969-12-31T23:59:59', -1000000),
+])
+def test_parse_fixed_layouts(value, expected):
+    assert parse_time_tag(value) == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2025-11-23T12:30:15+02:00', epoch(2025, 11, 23, 10, 30, 15)),
+    ('2025-11-23T12:30:15.250-01:00', epoch(2025, 11, 23, 13, 30, 15, 250000)),
+    ('2025-11-23T12:30+00:00', epoch(2025, 11, 23, 12, 30)),
+])
+def test_parse_offsets_through_fallback(value, expected):
+    assert parse_time_tag(value) == expected
+
+
+@pytest.mark.parametrize('value', [
+    '',
+    'garbage',
+    '2025-13-01',
+    '2025-11-23T12x00',
+    '2025-11-23T12:00:0x',
+    '2025-11-23T12:00x00',
+])
+def test_parse_rejects_malformed(value):
+    with pytest.raises(ValueError):
+        parse_time_tag(value)
+
+
+def test_parse_none_is_null():
+    assert parse_time_tag(None) == NULL_TIMESTAMP
+
+
+def test_parse_column_without_numpy():
+    values = ['2025-11-23T00:00:00', None, '2025-11-24 06:00:00.5', '2025-11-23T00:00:00Z']
+    parsed = parse_time_tags(iter(values), use_numpy=False)
+    assert isinstance(parsed, array) and parsed.typecode == 'q'
+    assert list(parsed) == [
+        epoch(2025, 11, 23), NULL_TIMESTAMP, epoch(2025, 11, 24, 6, 0, 0, 500000), epoch(2025, 11, 23)
+    ]
+
+
+@pytest.mark.skipif(time_codec.np is not None, reason="NumPy is installed")
+def test_numpy_path_requires_numpy():
+    with pytest.raises(ImportError):
+        parse_time_tags(['2025-11-23'], use_numpy=True)
+
+
+@pytest.mark.skipif(time_codec.np is None, reason="NumPy is not installed")
+def test_numpy_path_matches_fixed_parser():
+    values = ['2025-11-23T12:30:15.5Z', None, '2025-11-23 12:30', '2025-11-23T12:30:15+02:00']
+    assert parse_time_tags(values, use_numpy=True).tolist() == \
+        list(parse_time_tags(values, use_numpy=False))
+
+
+def test_format_round_trip_whole_seconds():
+    tags = ['2025-11-23T00:00:00', '1969-12-31T23:59:59', '2025-11-24T23:59:59']
+    assert format_time_tags(parse_time_tags(tags, use_numpy=False)) == tags
+
+
+def test_format_round_trip_with_fraction_and_nulls():
+    epochs = parse_time_tags(['2025-11-23T12:00:00', None, '2025-11-23T12:00:00.25'],
+                             use_numpy=False)
+    assert format_time_tags(epochs) == [
+        '2025-11-23T12:00:00.000000', None, '2025-11-23T12:00:00.250000'
+    ]
+    assert parse_time_tags(format_time_tags(epochs), use_numpy=False) == epochs
+
+
+def test_format_separator():
+    assert format_time_tag(epoch(2025, 11, 23, 1, 2, 3), sep=' ') == '2025-11-23 01:02:03'
+    assert format_time_tag(NULL_TIMESTAMP) is None
+
+
+def test_datetime_conversions():
+    value = datetime(2025, 11, 23, 12, 30, 15, 123456)
+    assert epoch_to_datetime(datetime_to_epoch(value)) == value
+
+    aware = datetime(2025, 11, 23, 14, 30, 15, tzinfo=timezone(timedelta(hours=2)))
+    assert datetime_to_epoch(aware) == epoch(2025, 11, 23, 12, 30, 15)
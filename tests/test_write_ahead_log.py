@@ -0,0 +1,175 @@
+"""
+Tests for the write-ahead log and DataArchiver recovery
+"""
+
+import json
+import os
+import threading
+import time
+
+from luft.storage import DataArchiver
+from luft.storage.write_ahead_log import RECORD_HEADER, WriteAheadLog
+
+
+def replayed(log_path):
+    records = []
+    log = WriteAheadLog(str(log_path))
+    try:
+        count = log.replay(lambda path, body: records.append((path, body)))
+    finally:
+        log.close()
+    assert count == len(records)
+    return records
+
+
+def test_replay_intact_records(tmp_path):
+    log_path = tmp_path / "archive.wal"
+    log = WriteAheadLog(str(log_path))
+    log.write("solar_wind/a.json", b'{"a": 1}')
+    log.write("solar_wind/b.json", b'{"b": 2}')
+    log.close()
+
+    assert replayed(log_path) == [
+        ("solar_wind/a.json", b'{"a": 1}'),
+        ("solar_wind/b.json", b'{"b": 2}'),
+    ]
+
+
+def test_replay_discards_torn_tail(tmp_path):
+    log_path = tmp_path / "archive.wal"
+    log = WriteAheadLog(str(log_path))
+    log.write("solar_wind/a.json", b'{"a": 1}')
+    intact_size = log.size
+    log.write("solar_wind/b.json", b'{"b": 2}')
+    log.close()
+
+    # Cut the second record short, as a crash mid-append would
+    with open(log_path, 'r+b') as f:
+        f.truncate(intact_size + RECORD_HEADER.size + 3)
+
+    assert replayed(log_path) == [("solar_wind/a.json", b'{"a": 1}')]
+
+
+def test_replay_discards_bad_crc_tail(tmp_path):
+    log_path = tmp_path / "archive.wal"
+    log = WriteAheadLog(str(log_path))
+    log.write("solar_wind/a.json", b'{"a": 1}')
+    log.write("solar_wind/b.json", b'{"b": 2}')
+    log.close()
+
+    data = bytearray(log_path.read_bytes())
+    data[-2] ^= 0xFF
+    log_path.write_bytes(bytes(data))
+
+    assert replayed(log_path) == [("solar_wind/a.json", b'{"a": 1}')]
+
+
+def test_lone_writer_does_not_wait_for_group(tmp_path):
+    log = WriteAheadLog(str(tmp_path / "archive.wal"), commit_interval=1.0)
+    try:
+        started = time.monotonic()
+        for i in range(5):
+            log.write(f"solar_wind/{i}.json", b'{}')
+        assert time.monotonic() - started < 1.0
+    finally:
+        log.close()
+
+
+def test_checkpoint_truncates_log(tmp_path):
+    archiver = DataArchiver(str(tmp_path / "archive"), wal=True, checkpoint_bytes=1)
+    try:
+        filepath = archiver.archive_data({'value': 1}, 'solar_wind')
+        assert archiver._wal.size == 0
+        assert archiver.retrieve_data(filepath)['data'] == {'value': 1}
+    finally:
+        archiver.close()
+
+
+def test_archiver_recovers_logged_write(tmp_path):
+    archive_path = tmp_path / "archive"
+    archiver = DataArchiver(str(archive_path), wal=True)
+    archiver.close()
+
+    # A record that reached the log before a crash prevented its apply
+    relative_path = "solar_wind/2025/11/23/20251123_120000_000000.json"
+    package = {'metadata': {'source': 'solar_wind'}, 'data': {'value': 2}}
+    log = WriteAheadLog(str(archive_path / DataArchiver.WAL_DIR / "archive.wal"))
+    log.write(relative_path, json.dumps(package).encode())
+    log.close()
+    assert not (archive_path / relative_path).exists()
+
+    archiver = DataArchiver(str(archive_path), wal=True)
+    try:
+        assert archiver.retrieve_data(str(archive_path / relative_path)) == package
+        assert archiver._wal.size == 0
+    finally:
+        archiver.close()
+
+
+def count_log_fsyncs(monkeypatch, log):
+    commits = []
+    fsync = os.fsync
+
+    def counting_fsync(fd):
+        if fd == log._file.fileno():
+            commits.append(fd)
+        fsync(fd)
+
+    monkeypatch.setattr(os, 'fsync', counting_fsync)
+    return commits
+
+
+def test_deferred_appends_share_one_commit(tmp_path, monkeypatch):
+    log = WriteAheadLog(str(tmp_path / "archive.wal"), commit_interval=5.0)
+    commits = count_log_fsyncs(monkeypatch, log)
+    try:
+        started = time.monotonic()
+        lsn = None
+        for i in range(10):
+            lsn = log.append(f"solar_wind/{i}.json", b'{}')
+        log.wait_durable(lsn)
+        # The waiting writer ends the group window early
+        assert time.monotonic() - started < 5.0
+        assert len(commits) == 1
+    finally:
+        log.close()
+
+
+def test_stream_cycle_commits_once(tmp_path, monkeypatch):
+    archiver = DataArchiver(str(tmp_path / "archive"), wal=True, commit_interval=5.0)
+    commits = count_log_fsyncs(monkeypatch, archiver._wal)
+    try:
+        feeds = [(f"feed_{i}", {'status': 'success', 'data': [i]}) for i in range(5)]
+        manifest_path = archiver.archive_stream(iter(feeds), 'solar_wind')
+        assert len(commits) == 1
+        assert archiver._wal._durable_lsn == archiver._wal._appended_lsn
+        assert len(dict(archiver.iter_stream(manifest_path))) == 5
+    finally:
+        archiver.close()
+
+
+def test_checkpoint_bounds_log_under_concurrent_writes(tmp_path):
+    checkpoint_bytes = 4096
+    archiver = DataArchiver(str(tmp_path / "archive"), wal=True, commit_interval=0.001,
+                            checkpoint_bytes=checkpoint_bytes)
+    sizes = []
+    paths = []
+
+    def writer(source):
+        for i in range(40):
+            paths.append(archiver.archive_data({'value': i}, source))
+            sizes.append(archiver._wal.size)
+
+    threads = [threading.Thread(target=writer, args=(f"source_{n}",)) for n in range(6)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # At most one record per writer can land past the threshold
+        record_size = 1024
+        assert max(sizes) < checkpoint_bytes + len(threads) * record_size
+        assert all(archiver.retrieve_data(path) for path in paths)
+    finally:
+        archiver.close()